@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Configuration
 VP_COLUMNS_KEY: list = [
@@ -18,6 +19,12 @@ REQUIRED_COLUMNS: Dict[str, str] = {
     "reference": "Référence"
 }
 
+# Fixed label sets of the classification columns (codes follow the order)
+CHANGE_TYPE_DTYPE = pd.CategoricalDtype(["New", "Spring Changed", "Unchanged"])
+MASS_STATUS_DTYPE = pd.CategoricalDtype(["Increased", "Decreased", "Unchanged"])
+# MASS_STATUS_DTYPE codes for a mass difference sign of -1 / 0 / +1
+MASS_STATUS_CODES = np.array([1, 2, 0], dtype=np.int8)
+
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize DataFrame columns:
@@ -45,6 +52,35 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             df[col] = s.fillna(0)
     return df
 
+def unique_moteurs(*dfs: Optional[pd.DataFrame]) -> np.ndarray:
+    """
+    Collect the sorted, non-empty unique "Moteur" values of several DataFrames.
+
+    The columns are concatenated and deduplicated in a single hash pass,
+    so only the unique values are sorted (in C, by name if numbers and
+    text are mixed) and checked for blanks.
+
+    Args:
+        *dfs: DataFrames to scan; None and frames without "Moteur" are skipped.
+
+    Returns:
+        Sorted array of unique motor names.
+    """
+    columns = [df["Moteur"].to_numpy() for df in dfs if df is not None and "Moteur" in df.columns]
+    if not columns:
+        return np.array([], dtype=object)
+
+    values = pd.unique(np.concatenate(columns))
+    values = values[pd.notna(values)]
+    try:
+        values = np.sort(values)
+    except TypeError:
+        # Mixed numbers and text (e.g. numeric motor codes) can't be compared
+        # directly; order those by their displayed name instead
+        values = values[np.argsort(values.astype(str), kind="stable")]
+    # Drop empty / whitespace-only names
+    return values[np.char.str_len(np.char.strip(values.astype(str))) > 0]
+
 def generate_results_df(
     old_df: pd.DataFrame,
     new_df: pd.DataFrame,
@@ -124,22 +160,22 @@ def generate_results_df(
     merged[mass_new] = merged.get(mass_new, 0).fillna(0).astype(float)
     
     # Compute mass differences/status and detect reference changes
-    merged["Mass Difference"] = merged[mass_new] - merged[mass_old]
-    merged["Mass Status"] = merged["Mass Difference"].apply(
-        lambda d: "Increased" if d > 0 else ("Decreased" if d < 0 else "Unchanged")
-    )
-    merged["Reference Status"] = merged.apply(
-        lambda r: "Change" if r[ref_old] != r[ref_new] else "No Change", axis=1
+    mass_diff = merged[mass_new].to_numpy() - merged[mass_old].to_numpy()
+    merged["Mass Difference"] = mass_diff
+    # sign(diff) + 1 indexes Decreased / Unchanged / Increased in one pass,
+    # building the categorical straight from its codes
+    merged["Mass Status"] = pd.Categorical.from_codes(
+        MASS_STATUS_CODES[np.sign(mass_diff).astype(np.intp) + 1], dtype=MASS_STATUS_DTYPE
     )
+    ref_changed = merged[ref_old].to_numpy() != merged[ref_new].to_numpy()
+    merged["Reference Status"] = np.where(ref_changed, "Change", "No Change")
     
-    # Classify each record
-    def classify(row: pd.Series) -> str:
-        if row["_merge"] == "right_only":
-            return "New"
-        # we drop 'left_only' rows later
-        return "Spring Changed" if row[ref_old] != row[ref_new] else "Unchanged"
-    
-    merged["Change Type"] = merged.apply(classify, axis=1)
+    # Classify each record, whole columns at a time: right-only rows are
+    # New, otherwise a reference change means Spring Changed
+    # (we drop 'left_only' rows later)
+    is_new = (merged["_merge"] == "right_only").to_numpy()
+    change_codes = np.where(is_new, 0, np.where(ref_changed, 1, 2)).astype(np.int8)
+    merged["Change Type"] = pd.Categorical.from_codes(change_codes, dtype=CHANGE_TYPE_DTYPE)
     
     # Filter out deleted cars
     merged = merged[merged["_merge"] != "left_only"]
@@ -1,72 +1,49 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QGridLayout, QScrollArea, QSizePolicy, QApplication
+    QGridLayout, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QThreadPool
 from PySide6.QtGui import QFont
-
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from functools import partial
 
 from utils.app_state import AppState
-from data_processing import generate_results_df
 from gui.components.metric_card import MetricCard
+from gui.components.moteur_list_view import MoteurListView
+from gui.components.static_canvas import StaticCanvas, chart_font
 from gui.styling import AppStyles
 
-class MatplotlibCanvas(FigureCanvas):
-    """A canvas for displaying matplotlib charts."""
-    
-    def __init__(self, width=5, height=4, dpi=100):
-        # Create figure with dark background
-        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor=AppStyles.DARK_CARD_BG)
-        self.axes = self.fig.add_subplot(111)
-        
-        # Style improvements for dark mode
-        self.axes.set_facecolor(AppStyles.DARK_CARD_BG)
-        self.axes.spines['bottom'].set_color(AppStyles.DARK_BORDER)
-        self.axes.spines['top'].set_color(AppStyles.DARK_BORDER)
-        self.axes.spines['left'].set_color(AppStyles.DARK_BORDER)
-        self.axes.spines['right'].set_color(AppStyles.DARK_BORDER)
-        self.axes.tick_params(colors=AppStyles.TEXT_COLOR)
-        self.axes.xaxis.label.set_color(AppStyles.TEXT_COLOR)
-        self.axes.yaxis.label.set_color(AppStyles.TEXT_COLOR)
-        self.axes.title.set_color(AppStyles.TEXT_COLOR)
-        
-        # Style improvements
-        self.fig.set_tight_layout(True)
-        
-        super().__init__(self.fig)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.setMinimumHeight(300)  # Ensure minimum height for visibility
-
-
 class AnalysisWidget(QWidget):
     """Widget for the analysis step."""
     
     analysis_completed = Signal()
     
+    # Charts are static once computed, so by default they are drawn by a
+    # StaticCanvas; set to True to embed the live (interactive) matplotlib canvas
+    interactive_charts = False
+    
     def __init__(self, state: AppState, parent=None):
         super().__init__(parent)
         self.state = state
+        self._analysis_task = None  # In-flight AnalysisTask, if any
+        self._pending_refresh = False  # Results arrived while the page was hidden
         self.init_ui()
         
         # Run analysis automatically if data is available and analysis wasn't completed
         if not self.state.analysis_completed and self.state.old_df is not None and self.state.new_df is not None:
-            # Using a small delay to allow the UI to fully load first
+            # Start as soon as the event loop is idle so the UI can load first
             from PySide6.QtCore import QTimer
-            QTimer.singleShot(100, self.run_analysis)
+            QTimer.singleShot(0, self._auto_run_analysis)
 
     def init_ui(self):
         """Initialize the user interface."""
-        # Apply dark mode style
-        self.setStyleSheet(AppStyles.DARK_MODE_STYLE)
+        # Dark mode comes from the application-wide stylesheet set in main()
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Header - White text on primary color
         header_label = QLabel("🔍 Step 2: Data Analysis")
-        header_label.setFont(QFont("Arial", 16, QFont.Bold))
+        header_label.setFont(AppStyles.font("Arial", 16, QFont.Bold))
         header_label.setStyleSheet(f"color: white; background-color: {AppStyles.PRIMARY_COLOR}; padding: 8px; border-radius: 4px;")
         layout.addWidget(header_label)
         
@@ -78,20 +55,38 @@ class AnalysisWidget(QWidget):
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setSpacing(20)  # Add more space between sections
         
+        # Error message shown when the background analysis fails
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color: #FF5733;")
+        self.error_label.setVisible(False)
+        scroll_layout.addWidget(self.error_label)
+        
         # Analysis Overview section
         overview_label = QLabel("📊 Analysis Overview")
         overview_label.setStyleSheet(AppStyles.SECTION_HEADER_STYLE)
         scroll_layout.addWidget(overview_label)
         
         # Metrics section
-        metrics_frame = QFrame()
-        metrics_layout = QGridLayout(metrics_frame)
+        self.metrics_frame = QFrame()
+        metrics_layout = QGridLayout(self.metrics_frame)
         metrics_layout.setContentsMargins(0, 10, 0, 10)
         metrics_layout.setSpacing(10)  # Add space between metrics
 
-        # Will be populated when analysis runs
-        self.metrics_layout = metrics_layout
-        scroll_layout.addWidget(metrics_frame)
+        # Cards are built once; their values are filled in when analysis runs
+        self.cards = {
+            "total_old": MetricCard("🚙 Total Cars in Old File", 0),
+            "total_new": MetricCard("🚗 Total Cars in New File", 0),
+            "new": MetricCard("🟥 New Cars", 0,
+                              help_text="Cars that did not exist in the old PTA file"),
+            "spring": MetricCard("🔁 Spring Changed Cars", 0),
+            "unchanged": MetricCard("✅ Unchanged Cars", 0),
+        }
+        # First row: old, new, new cars; second row: spring changed, unchanged
+        positions = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1)]
+        for card, (row, col) in zip(self.cards.values(), positions):
+            metrics_layout.addWidget(card, row, col)
+        self.metrics_frame.hide()
+        scroll_layout.addWidget(self.metrics_frame)
 
         self.change_type_label = QLabel("🔄 Change Type Distribution")
         self.change_type_label.setStyleSheet(AppStyles.SECTION_HEADER_STYLE)
@@ -100,6 +95,9 @@ class AnalysisWidget(QWidget):
         self.change_type_container = QFrame()
         self.change_type_container.setMinimumHeight(350)
         self.change_type_layout = QVBoxLayout(self.change_type_container)
+        
+        # Single canvas reused across refreshes, created with the first chart
+        self.change_type_canvas = None
         scroll_layout.addWidget(self.change_type_container)
         
         # Add Moteur list section
@@ -123,7 +121,7 @@ class AnalysisWidget(QWidget):
         self.analyze_button = QPushButton("📊 Proceed to Results")
         self.analyze_button.setMinimumHeight(40)
         self.analyze_button.setStyleSheet(AppStyles.ACTIVE_BUTTON_STYLE)
-        self.analyze_button.clicked.connect(self.view_results)
+        self.analyze_button.clicked.connect(self.view_results, Qt.DirectConnection)
         button_layout.addWidget(self.analyze_button)
         
         layout.addLayout(button_layout)
@@ -134,114 +132,193 @@ class AnalysisWidget(QWidget):
             self.analyze_button.setEnabled(True)
             self.analyze_button.setStyleSheet(AppStyles.COMPLETED_BUTTON_STYLE)
     
+    def _auto_run_analysis(self):
+        """Run the initial analysis unless one was already started or finished."""
+        if self._analysis_task is None and not self.state.analysis_completed:
+            self.run_analysis()
+
     def run_analysis(self):
-        """Perform data analysis and update the UI."""
-        try:
-            # Clear previous results
-            self.clear_ui_elements()
-            
-            # Check if we have the required data
-            if self.state.old_df is None or self.state.new_df is None:
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "Missing Data", "Both old and new PTA files are required for analysis")
-                return
-            
-            # Process the cursor
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
-            # Generate results
-            result_df = generate_results_df(
-                self.state.old_df,
-                self.state.new_df,
-                self.state.pta_type
-            )
-            
-            # Store results in state
-            self.state.results_df = result_df
-            self.state.analysis_completed = True
-            
-            # Update UI with results
-            self.update_ui_with_results()
-            
-            # Enable results button
-            self.analyze_button.setEnabled(True)
-            self.analyze_button.setStyleSheet(AppStyles.COMPLETED_BUTTON_STYLE)
-            
-            # Emit completion signal
-            self.analysis_completed.emit()
-            
-            # Process the cursor
-            QApplication.restoreOverrideCursor()
-            
-        except Exception as e:
-            # Handle errors
-            QApplication.restoreOverrideCursor()
-            
+        """Start the data analysis on a background thread."""
+        # Ignore repeated requests while a run on the same data is in progress
+        if self._analysis_task is not None and self._is_current(self._analysis_task):
+            return
+
+        # Clear previous results
+        self.clear_ui_elements()
+
+        # Check if we have the required data
+        if self.state.old_df is None or self.state.new_df is None:
             from PySide6.QtWidgets import QMessageBox
-            QMessageBox.critical(self, "Analysis Error", f"Error during analysis: {str(e)}")
-            
-            error_label = QLabel(f"❌ Error during analysis: {str(e)}")
-            error_label.setStyleSheet("color: #FF5733;")
-            self.stats_layout.addWidget(error_label)
+            QMessageBox.warning(self, "Missing Data", "Both old and new PTA files are required for analysis")
+            return
+
+        # The previous results no longer apply once a new run starts
+        self.state.results_df = None
+        self.state.analysis_completed = False
+
+        # Disable the results button until the worker reports back
+        self.analyze_button.setEnabled(False)
+
+        # Generate results off the GUI thread; the task keeps the inputs it
+        # was given, so a result for replaced data can be recognized and dropped
+        from gui.components.workers import AnalysisTask
+        task = AnalysisTask(
+            self.state.old_df,
+            self.state.new_df,
+            self.state.pta_type
+        )
+        task.signals.finished.connect(partial(self._on_analysis_done, task))
+        task.signals.error.connect(partial(self._on_analysis_error, task))
+        self._analysis_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _is_current(self, task):
+        """Whether task was started on the data and PTA type now in the state."""
+        return (
+            task.old_df is self.state.old_df
+            and task.new_df is self.state.new_df
+            and task.pta_type == self.state.pta_type
+        )
+
+    def _on_analysis_done(self, task, result_df):
+        """Store the worker's results and refresh the UI."""
+        if task is not self._analysis_task:
+            return  # Superseded by a later run
+        self._analysis_task = None
+        if not self._is_current(task):
+            return  # The files or PTA type changed while it ran
+
+        # Store results in state
+        self.state.results_df = result_df
+        self.state.analysis_completed = True
+
+        # Update UI with results
+        self.update_ui_with_results()
+
+        # Enable results button
+        self.analyze_button.setEnabled(True)
+        self.analyze_button.setStyleSheet(AppStyles.COMPLETED_BUTTON_STYLE)
+
+        # Emit completion signal
+        self.analysis_completed.emit()
+
+    def _on_analysis_error(self, task, message):
+        """Report an analysis failure raised on the worker thread."""
+        if task is not self._analysis_task:
+            return  # Superseded by a later run
+        self._analysis_task = None
+        # The results button stays disabled: there are no results to show
+
+        from PySide6.QtWidgets import QMessageBox
+        QMessageBox.critical(self, "Analysis Error", f"Error during analysis: {message}")
+
+        self.error_label.setText(f"❌ Error during analysis: {message}")
+        self.error_label.setVisible(True)
     
     def update_ui_with_results(self):
-        """Update UI with analysis results."""
+        """Update UI with analysis results, deferred until the page is shown."""
+        if not self.isVisible():
+            self._pending_refresh = True
+            return
+        self._pending_refresh = False
+        self._refresh_results()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self._refresh_results()
+
+    def _refresh_results(self):
+        """Fill the metrics, chart and motor list from the current results."""
         result_df = self.state.results_df
         if result_df is None or result_df.empty:
             return
 
+        # Tally the results once for both the metrics and the chart
+        summary = self._summary(result_df)
+
         # Overview metrics
-        self.add_metrics(result_df)
+        self.add_metrics(summary)
 
         # Change type chart
-        self.add_change_type_chart(result_df)
+        self.add_change_type_chart(summary)
         
         # Add Moteur list display
         self.add_moteur_list()
     
-    def add_metrics(self, result_df):
-        """Add metrics cards to the grid layout."""
-        # Clear existing items
-        for i in reversed(range(self.metrics_layout.count())):
-            item = self.metrics_layout.itemAt(i)
-            if item.widget():
-                item.widget().setParent(None)
+    def _summary(self, result_df):
+        """
+        Return the counts shown by the metrics and chart for result_df.
+
+        The summary is memoized on the app state together with the DataFrame
+        it was computed from, so showing the same results again does not
+        rescan them.
+        """
+        cached = self.state.results_summary
+        if cached is not None and cached[0] is result_df:
+            return cached[1]
+
+        summary = {
+            "total_cars": len(result_df),
+            "has_change_type": "Change Type" in result_df.columns,
+            "change_counts": self.count_change_types(result_df),
+        }
+        self.state.results_summary = (result_df, summary)
+        return summary
+
+    @staticmethod
+    def count_change_types(result_df):
+        """
+        Count rows per change type in a single pass over the column.
+
+        The categorical integer codes (as produced by generate_results_df) are
+        tallied with np.bincount, instead of scanning the strings once per label.
+
+        Returns:
+            Series of counts indexed by change type, sorted by descending count.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if "Change Type" not in result_df.columns:
+            return pd.Series(dtype="int64")
+
+        change_type = result_df["Change Type"]
+        if not isinstance(change_type.dtype, pd.CategoricalDtype):
+            change_type = change_type.astype("category")
+        categories = change_type.cat.categories
+        codes = change_type.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        counts = pd.Series(counts, index=categories)
+        return counts[counts > 0].sort_values(ascending=False, kind="stable")
 
+    def add_metrics(self, summary):
+        """Fill the metric cards with the analysis figures."""
         # Calculate metrics
-        total_cars = len(result_df)
+        total_cars = summary["total_cars"]
+        change_counts = summary["change_counts"]
         # Add total cars in old file
         total_old_cars = len(self.state.old_df) if self.state.old_df is not None else 0
-        total_new = (result_df["Change Type"] == "New").sum()
-        total_spring = (result_df["Change Type"] == "Spring Changed").sum()
-        total_unchanged = (result_df["Change Type"] == "Unchanged").sum()
-
-        # Add metrics to grid
-        metrics = [
-            MetricCard("🚙 Total Cars in Old File", total_old_cars),
-            MetricCard("🚗 Total Cars in New File", total_cars),
-            MetricCard("🟥 New Cars", total_new,
-                      help_text="Cars that did not exist in the old PTA file"),
-            MetricCard("🔁 Spring Changed Cars", total_spring,
-                      f"{(total_spring / total_cars) * 100:.1f} %"),
-            MetricCard("✅ Unchanged Cars", total_unchanged),
-        ]
-
-        # Add metrics to grid (first row: new, old, new cars; second row: spring changed, unchanged)
-        positions = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1)]
+        total_new = int(change_counts.get("New", 0))
+        total_spring = int(change_counts.get("Spring Changed", 0))
+        total_unchanged = int(change_counts.get("Unchanged", 0))
 
-        for i, (metric, pos) in enumerate(zip(metrics, positions)):
-            self.metrics_layout.addWidget(metric, pos[0], pos[1])
+        self.cards["total_old"].set_value(total_old_cars)
+        self.cards["total_new"].set_value(total_cars)
+        self.cards["new"].set_value(total_new)
+        self.cards["spring"].set_value(total_spring, f"{(total_spring / total_cars) * 100:.1f} %")
+        self.cards["unchanged"].set_value(total_unchanged)
+        self.metrics_frame.show()
 
-    def add_change_type_chart(self, result_df):
+    def add_change_type_chart(self, summary):
         """Add bar chart of change type distribution."""
-        for i in reversed(range(self.change_type_layout.count())):
-            self.change_type_layout.itemAt(i).widget().setParent(None)
-        
-        canvas = MatplotlibCanvas(width=6, height=4)
+        canvas = self._chart_canvas()
+        canvas.reset_axes()
         
         # Create bar chart
-        if "Change Type" in result_df.columns:
-            counts = result_df["Change Type"].value_counts()
+        if summary["has_change_type"]:
+            counts = summary["change_counts"]
             
             # Color mapping for consistency - Updated colors
             colors = {
@@ -255,17 +332,12 @@ class AnalysisWidget(QWidget):
             bars = canvas.axes.bar(counts.index, counts.values, color=chart_colors)
             
             # Add labels
-            for bar in bars:
-                height = bar.get_height()
-                canvas.axes.text(
-                    bar.get_x() + bar.get_width()/2.,
-                    height,
-                    f'{int(height)}',
-                    ha='center', va='bottom',
-                    fontweight='bold'
-                )
+            canvas.axes.bar_label(
+                bars, labels=[f'{int(v)}' for v in counts.values],
+                fontproperties=chart_font(weight='bold'), padding=3
+            )
             
-            canvas.axes.set_title("Car Change Classification", fontsize=14, fontweight='bold')
+            canvas.axes.set_title("Car Change Classification", fontproperties=chart_font(size=14, weight='bold'))
             canvas.axes.set_xlabel("Change Type")
             canvas.axes.set_ylabel("Count")
             
@@ -273,86 +345,74 @@ class AnalysisWidget(QWidget):
             canvas.axes.spines['top'].set_visible(False)
             canvas.axes.spines['right'].set_visible(False)
             canvas.axes.grid(axis='y', linestyle='--', alpha=0.7)
-            
-            self.change_type_layout.addWidget(canvas)
         else:
-            label = QLabel("No data available for change type analysis.")
-            self.change_type_layout.addWidget(label)
+            canvas.axes.text(
+                0.5, 0.5, "No data available for change type analysis.",
+                ha='center', va='center', transform=canvas.axes.transAxes
+            )
+        
+        # Coalesce repaints into the next event loop pass
+        canvas.draw_idle()
+
+    def _chart_canvas(self):
+        """Return the chart canvas, creating it (and loading matplotlib) on first use."""
+        if self.change_type_canvas is None:
+            if self.interactive_charts:
+                from gui.components.matplotlib_canvas import MatplotlibCanvas as canvas_class
+            else:
+                canvas_class = StaticCanvas
+            self.change_type_canvas = canvas_class(width=6, height=4)
+            self.change_type_layout.addWidget(self.change_type_canvas)
+        return self.change_type_canvas
 
     def add_moteur_list(self):
         """Add a list display of unique motor types."""
         # Clear previous content
-        for i in reversed(range(self.moteur_layout.count())):
-            self.moteur_layout.itemAt(i).widget().setParent(None)
+        self._clear_layout(self.moteur_layout)
             
-        moteurs = []
+        from data_processing import unique_moteurs
+        moteurs = unique_moteurs(self.state.new_df, self.state.old_df)
         
-        # Check new file
-        if self.state.new_df is not None and "Moteur" in self.state.new_df.columns:
-            moteurs.extend(self.state.new_df["Moteur"].dropna().unique())
-            
-        # Check old file 
-        if self.state.old_df is not None and "Moteur" in self.state.old_df.columns:
-            moteurs.extend(self.state.old_df["Moteur"].dropna().unique())
-            
-        # Get sorted unique motors (remove duplicates)
-        unique_moteurs = sorted(set(moteurs))
-        
-        if not unique_moteurs:
+        if len(moteurs) == 0:
             label = QLabel("No motor data available in uploaded files")
             label.setStyleSheet("color: #CCCCCC; font-style: italic;")
             self.moteur_layout.addWidget(label)
             return
             
         # Display count
-        count_label = QLabel(f"Found {len(unique_moteurs)} unique motor types")
+        count_label = QLabel(f"Found {len(moteurs)} unique motor types")
         count_label.setStyleSheet("color: #CCCCCC; font-style: italic; margin-bottom: 10px;")
         self.moteur_layout.addWidget(count_label)
         
-        # Create scrollable area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet(f"background-color: {AppStyles.DARK_CARD_BG}; border: 1px solid {AppStyles.DARK_BORDER};")
-        
-        moteur_widget = QWidget()
-        grid_layout = QGridLayout(moteur_widget)
-        grid_layout.setHorizontalSpacing(20)
-        grid_layout.setVerticalSpacing(5)
-        
-        # Calculate number of columns based on typical length of motor names
-        num_columns = 3  # Adjust based on typical width
-        
-        # Add motors to grid
-        for i, moteur in enumerate(unique_moteurs):
-            if moteur and str(moteur).strip():  # Skip empty values
-                row = i // num_columns
-                col = i % num_columns
-                
-                moteur_label = QLabel(f"• {moteur}")
-                moteur_label.setStyleSheet("color: #CCCCCC; font-size: 13px; padding: 2px;")
-                grid_layout.addWidget(moteur_label, row, col)
-                
-        scroll.setWidget(moteur_widget)
-        self.moteur_layout.addWidget(scroll)
+        self.moteur_layout.addWidget(MoteurListView(moteurs))
 
     def clear_ui_elements(self):
         """Clear all UI elements containing results."""
-        # Clear metrics
-        for i in reversed(range(self.metrics_layout.count())):
-            item = self.metrics_layout.itemAt(i)
-            if item.widget():
-                item.widget().setParent(None)
+        self.error_label.setVisible(False)
+        
+        # Hide metrics until the next results are in
+        self.metrics_frame.hide()
                 
-        for i in reversed(range(self.change_type_layout.count())):
-            item = self.change_type_layout.itemAt(i)
-            if item.widget():
-                item.widget().setParent(None)
+        # Reset the chart without destroying its canvas
+        if self.change_type_canvas is not None:
+            self.change_type_canvas.reset_axes()
+            self.change_type_canvas.draw_idle()
         
         # Clear moteur list
-        for i in reversed(range(self.moteur_layout.count())):
-            item = self.moteur_layout.itemAt(i)
-            if item.widget():
-                item.widget().setParent(None)
+        self._clear_layout(self.moteur_layout)
+
+    @staticmethod
+    def _clear_layout(layout):
+        """Remove every widget from a layout with a single relayout/repaint."""
+        container = layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        while (item := layout.takeAt(0)) is not None:
+            widget = item.widget()
+            if widget:
+                # Hide now, let Qt destroy the widget from the event loop
+                widget.hide()
+                widget.deleteLater()
+        container.setUpdatesEnabled(True)
     
     def view_results(self):
         """Navigate to the results page."""
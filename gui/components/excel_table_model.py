@@ -1,66 +1,245 @@
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QHeaderView
 import pandas as pd
 import numpy as np
 
+def _format_value(value) -> str:
+    """Format a non-missing cell of unknown type (object columns can mix numbers and text)."""
+    # Floats: drop trailing .0, else two decimals
+    if isinstance(value, (float, np.floating)):
+        return str(int(value)) if value == int(value) else f"{value:.2f}"
+    # Ints
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    # Everything else
+    return str(value)
+
+def _format_column(column: pd.Series) -> np.ndarray:
+    """
+    Format a whole column to display strings in one vectorized pass.
+
+    Float columns drop a trailing .0 and otherwise show two decimals;
+    integer columns are plain digits. Other columns (object, bool, dates,
+    categoricals) fall back to per-value formatting. Missing values are
+    found with one column-wide mask and shown blank.
+
+    Args:
+        column: The column to format.
+
+    Returns:
+        Object array of display strings.
+    """
+    values = column.to_numpy()
+    if values.dtype.kind == "f":
+        values = values + 0.0  # turns -0.0 into 0.0, as str(int(-0.0)) would
+        whole = values == np.trunc(values)  # False for NaN
+        # One C-level sprintf pass per format, each over only its own cells
+        text = np.full(values.shape, "", dtype=object)
+        fractional = ~whole & ~np.isnan(values)
+        text[whole] = np.char.mod("%.0f", values[whole])
+        text[fractional] = np.char.mod("%.2f", values[fractional])
+        return text
+    if values.dtype.kind in "iu":
+        return values.astype(str).astype(object)
+    # Python scalars / Timestamps, as a cell-by-cell read would see them;
+    # only the present values go through the per-value formatter
+    missing = column.isna().to_numpy()
+    text = np.full(len(column), "", dtype=object)
+    text[~missing] = [_format_value(v) for v in column[~missing].astype(object)]
+    return text
+
+# Height of every table row in pixels: the default the styled views already use
+ROW_HEIGHT = 30
+
+def use_fixed_row_height(table_view):
+    """
+    Give every row of a table view the same fixed height.
+
+    With a Fixed vertical header the view lays rows out by arithmetic
+    instead of asking the model for per-row size hints and fonts.
+
+    Args:
+        table_view: The QTableView to configure.
+    """
+    header = table_view.verticalHeader()
+    header.setDefaultSectionSize(ROW_HEIGHT)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+
+def sort_on_header_click(table_view):
+    """
+    Turn on sorting for a table view the first time a column header is clicked.
+
+    QTableView.setSortingEnabled(True) sorts right away by the header's
+    default indicator; deferring it keeps the data's own row order (and
+    skips the sort) until the user asks for one.
+
+    Args:
+        table_view: The QTableView to configure.
+    """
+    header = table_view.horizontalHeader()
+
+    def on_first_click(section):
+        header.sectionClicked.disconnect(on_first_click)
+        header.setSortIndicator(section, Qt.AscendingOrder)
+        table_view.setSortingEnabled(True)  # Sorts by the indicator just set
+
+    header.sectionClicked.connect(on_first_click)
+
 class DataFrameModel(QAbstractTableModel):
-    """Model for displaying pandas DataFrames in QTableView, complete with headers."""
+    """
+    Model for displaying pandas DataFrames in QTableView, complete with headers.
+
+    Row 0 shows the column names (including the former index column); data
+    rows follow from row 1. The header row is synthesized on the fly instead
+    of being concatenated onto a copy of the frame.
+
+    Rows have no per-row size: SizeHintRole (like every role without a
+    handler) is answered with None straight away. Views should call
+    use_fixed_row_height() so they never measure rows.
+    """
+
+    # Shared role values, so data()/headerData() return them without allocating
+    _ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+    _ALIGN_LEFT = int(Qt.AlignLeft | Qt.AlignVCenter)
+    _ALIGN_CENTER = int(Qt.AlignCenter)
+    _BOLD_FONT = None  # Created with the first model, once QApplication exists
 
     def __init__(self, data: pd.DataFrame = None, parent=None):
         super().__init__(parent)
-        # Copy so we don't mutate the original
-        if data is not None:
-            # Reset index to make it a column and include column names as first row
-            df = data.copy()
-            # Convert index to column
-            df.reset_index(inplace=True)
-            # Prepare header row
-            header_row = pd.DataFrame([df.columns], columns=df.columns)
-            # Concatenate header row with data
-            self.dataframe = pd.concat([header_row, df], ignore_index=True)
-        else:
-            self.dataframe = pd.DataFrame()
+        if DataFrameModel._BOLD_FONT is None:
+            DataFrameModel._BOLD_FONT = QFont()
+            DataFrameModel._BOLD_FONT.setBold(True)
+        # Role -> handler(row, col) used by data()
+        self._role_handlers = {
+            Qt.DisplayRole: self._display_data,
+            Qt.TextAlignmentRole: self._alignment_data,
+            Qt.FontRole: self._font_data,
+        }
+        self._sort_key = None  # (column, order) of the last sort() call
+        self._set_dataframe(self._with_index_column(data))
+
+    @staticmethod
+    def _with_index_column(data: pd.DataFrame) -> pd.DataFrame:
+        """Return data with its index turned into a column (reset_index returns a new frame)."""
+        return data.reset_index() if data is not None else pd.DataFrame()
+
+    def _set_dataframe(self, frame: pd.DataFrame):
+        """Store the frame and precompute what the view will ask for."""
+        self._df = frame
+        # Frame positions of the data rows in display order (None: frame order)
+        self._row_order = None
+        # Column names for the synthesized header row, stringified once
+        self._header = np.array([str(c) for c in self._df.columns], dtype=object)
+
+        # Display strings are formatted once per reset, column by column, so
+        # painting is a plain array lookup
+        self._display = np.empty(self._df.shape, dtype=object)
+        # Columns are homogeneously typed, so pick each column's alignment
+        # once; object columns get a per-row list, since they can mix types
+        self._alignments = []
+        for i in range(self._df.shape[1]):
+            column = self._df.iloc[:, i]
+            self._display[:, i] = _format_column(column)
+            if column.dtype.kind in "fiu":
+                self._alignments.append(self._ALIGN_RIGHT)
+            else:
+                self._alignments.append(self._value_alignments(column))
+
+        # Bold any cell in a “Reference” column
+        # (one vectorized test over the column names, per reset)
+        is_reference = self._df.columns.astype(str).str.lower().str.contains("reference", regex=False)
+        self._bold_cols = set(np.flatnonzero(is_reference).tolist())
+
+    def _value_alignments(self, column: pd.Series) -> list:
+        """Numbers right‑aligned, text left‑aligned, decided per value."""
+        return [
+            self._ALIGN_RIGHT if isinstance(value, (int, float, np.number)) else self._ALIGN_LEFT
+            for value in column.to_numpy(dtype=object)
+        ]
 
     def rowCount(self, parent=QModelIndex()):
-        return self.dataframe.shape[0]
+        # +1 for the synthesized header row, when there are any columns
+        return len(self._df) + 1 if self._df.shape[1] else 0
 
     def columnCount(self, parent=QModelIndex()):
-        return self.dataframe.shape[1]
+        return self._df.shape[1]
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
-        if not index.isValid():
+        # Roles this model doesn't answer (most of Qt's queries) return at once
+        handler = self._role_handlers.get(role)
+        if handler is None or not index.isValid():
             return None
+        return handler(index.row(), index.column())
 
-        value = self.dataframe.iloc[index.row(), index.column()]
+    def _display_data(self, row: int, col: int):
+        if row == 0:
+            # Header row: the column name
+            return self._header[col]
+        return self._display[row - 1, col]
 
-        if role == Qt.DisplayRole:
-            # Blank for NaN
-            if pd.isna(value):
-                return ""
-            # Floats: drop trailing .0, else two decimals
-            if isinstance(value, (float, np.floating)):
-                return str(int(value)) if value == int(value) else f"{value:.2f}"
-            # Ints
-            if isinstance(value, (int, np.integer)):
-                return str(int(value))
-            # Everything else
-            return str(value)
+    def _alignment_data(self, row: int, col: int):
+        if row == 0:
+            return self._ALIGN_LEFT
+        alignment = self._alignments[col]
+        if isinstance(alignment, list):
+            return alignment[row - 1]
+        return alignment
 
-        if role == Qt.TextAlignmentRole:
-            # Numbers right‑aligned, text left‑aligned
-            if isinstance(value, (int, float, np.number)):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
+    def _font_data(self, row: int, col: int):
+        return self._BOLD_FONT if col in self._bold_cols else None
 
-        if role == Qt.FontRole:
-            # Bold any cell in a “Reference” column
-            col_name = self.dataframe.columns[index.column()]
-            if col_name.lower().endswith("reference") or "reference" in col_name.lower():
-                font = QFont()
-                font.setBold(True)
-                return font
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """
+        Sort the data rows by a column; the header row stays on top.
 
-        return None
+        The frame itself is left alone: the precomputed per-row arrays are
+        reordered through one stable permutation, so successive sorts on
+        different columns keep ties in their previous order.
+        """
+        if not 0 <= column < self._df.shape[1]:
+            return
+        self._sort_key = (column, order)
+        permutation = self._sort_permutation(column, order)
+
+        self.layoutAboutToBeChanged.emit()
+        self._permute_rows(permutation)
+        # Keep selections and the current cell on the same data rows
+        new_position = np.empty_like(permutation)
+        new_position[permutation] = np.arange(len(permutation))
+        persistent = self.persistentIndexList()
+        moved = [
+            self.index(int(new_position[index.row() - 1]) + 1, index.column())
+            if index.row() > 0 else index
+            for index in persistent
+        ]
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
+
+    def _sort_permutation(self, column: int, order) -> np.ndarray:
+        """Return the stable permutation (of current display positions) sorting by column."""
+        keys = self._df.iloc[:, column]
+        if self._row_order is not None:
+            keys = keys.take(self._row_order)
+        ascending = order == Qt.AscendingOrder
+        try:
+            ranked = keys.reset_index(drop=True).sort_values(ascending=ascending, kind="stable")
+        except TypeError:
+            # Mixed types can't be compared; order those by their display text
+            ranked = pd.Series(self._display[:, column]).sort_values(ascending=ascending, kind="stable")
+        return ranked.index.to_numpy()
+
+    def _permute_rows(self, permutation: np.ndarray):
+        """Reorder every per-row array by permutation (positions in the current display order)."""
+        self._display = self._display[permutation]
+        self._alignments = [
+            [alignment[i] for i in permutation] if isinstance(alignment, list) else alignment
+            for alignment in self._alignments
+        ]
+        if self._row_order is None:
+            self._row_order = permutation
+        else:
+            self._row_order = self._row_order[permutation]
 
     def headerData(self,
                    section: int,
@@ -71,25 +250,22 @@ class DataFrameModel(QAbstractTableModel):
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
                 # Column header text
-                try:
-                    return str(self.dataframe.columns[section])
-                except IndexError:
-                    return ""
+                if 0 <= section < len(self._header):
+                    return self._header[section]
+                return ""
             else:
                 # 1‑based row numbers
                 return str(section + 1)
 
         if role == Qt.FontRole:
             # Make all headers bold
-            font = QFont()
-            font.setBold(True)
-            return font
+            return self._BOLD_FONT
 
         if role == Qt.TextAlignmentRole:
             # Center column headers, right‑align row numbers
             if orientation == Qt.Horizontal:
-                return Qt.AlignCenter
-            return Qt.AlignRight | Qt.AlignVCenter
+                return self._ALIGN_CENTER
+            return self._ALIGN_RIGHT
 
         return None
 
@@ -99,16 +275,26 @@ class DataFrameModel(QAbstractTableModel):
 
     def update_dataframe(self, dataframe: pd.DataFrame):
         """Replace the underlying DataFrame (and refresh view)."""
-        self.beginResetModel()
-        if dataframe is not None:
-            # Reset index to make it a column and include column names as first row
-            df = dataframe.copy()
-            # Convert index to column
-            df.reset_index(inplace=True)
-            # Prepare header row
-            header_row = pd.DataFrame([df.columns], columns=df.columns)
-            # Concatenate header row with data
-            self.dataframe = pd.concat([header_row, df], ignore_index=True)
-        else:
-            self.dataframe = pd.DataFrame()
-        self.endResetModel()
+        frame = self._with_index_column(dataframe)
+        if frame.shape != self._df.shape or not frame.columns.equals(self._df.columns):
+            # New layout: the view has to rebuild rows, columns and headers
+            self.beginResetModel()
+            self._set_dataframe(frame)
+            self._resort()
+            self.endResetModel()
+            return
+
+        # Same layout: refresh the cells in place, keeping selection and scroll
+        self._set_dataframe(frame)
+        self._resort()
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, self.columnCount() - 1),
+                list(self._role_handlers),  # Every role served, subclass ones included
+            )
+
+    def _resort(self):
+        """Apply the view's current sort to freshly stored data (the caller notifies views)."""
+        if self._sort_key is not None and self._sort_key[0] < self._df.shape[1]:
+            self._permute_rows(self._sort_permutation(*self._sort_key))
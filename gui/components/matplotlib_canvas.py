@@ -0,0 +1,21 @@
+from PySide6.QtWidgets import QSizePolicy
+from PySide6.QtCore import Qt
+
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+from gui.components.static_canvas import ChartAxesMixin
+
+
+class MatplotlibCanvas(ChartAxesMixin, FigureCanvas):
+    """An interactive canvas for displaying matplotlib charts."""
+
+    def __init__(self, width=5, height=4, dpi=100):
+        self.init_figure(width, height, dpi)
+
+        super().__init__(self.fig)
+        # The Agg buffer covers every pixel, so Qt need not clear it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumHeight(300)  # Ensure minimum height for visibility
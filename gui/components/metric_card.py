@@ -31,34 +31,49 @@ class MetricCard(QFrame):
         
         # Title
         title_label = QLabel(self.title)
-        title_label.setStyleSheet(AppStyles.METRIC_TITLE_STYLE)
+        title_label.setObjectName("metricTitle")
         layout.addWidget(title_label)
         
         # Value
-        value_label = QLabel(str(self.value))
-        value_label.setFont(QFont("Arial", 18, QFont.Bold))
-        value_label.setStyleSheet(AppStyles.METRIC_VALUE_STYLE)
-        layout.addWidget(value_label)
+        self.value_label = QLabel(str(self.value))
+        self.value_label.setFont(AppStyles.font("Arial", 18, QFont.Bold))
+        self.value_label.setObjectName("metricValue")
+        layout.addWidget(self.value_label)
         
-        # Delta (if provided)
-        if self.delta:
-            delta_text = f"△ {self.delta}"
-            delta_label = QLabel(delta_text)
-            
-            # Style based on positive/negative
-            if isinstance(self.delta, str) and '-' in self.delta:
-                delta_label.setStyleSheet(AppStyles.METRIC_DELTA_NEGATIVE_STYLE)
-            else:
-                delta_label.setStyleSheet(AppStyles.METRIC_DELTA_STYLE)
-                
-            layout.addWidget(delta_label)
+        # Delta (always created so it can be filled in later)
+        self.delta_label = QLabel()
+        self.delta_label.setObjectName("metricDelta")
+        layout.addWidget(self.delta_label)
+        self._apply_delta(self.delta)
         
         # Help text (if provided)
         if self.help_text:
             help_label = QLabel(self.help_text)
             help_label.setWordWrap(True)
-            help_label.setStyleSheet("color: #666; font-size: 10px;")
+            help_label.setObjectName("metricHelp")
             help_label.setAlignment(Qt.AlignLeft)
             layout.addWidget(help_label)
         
         layout.addStretch()
+    
+    def set_value(self, value, delta=None):
+        """Update the displayed value and delta in place."""
+        self.value = value
+        self.value_label.setText(str(value))
+        self._apply_delta(delta)
+    
+    def _apply_delta(self, delta):
+        """Show the delta indicator, styled by sign, or hide it if empty."""
+        self.delta = delta
+        if not delta:
+            self.delta_label.hide()
+            return
+        
+        self.delta_label.setText(f"△ {delta}")
+        # Style based on positive/negative; re-polish so the property selector applies
+        negative = isinstance(delta, str) and '-' in delta
+        if self.delta_label.property("negative") != negative:
+            self.delta_label.setProperty("negative", negative)
+            self.delta_label.style().unpolish(self.delta_label)
+            self.delta_label.style().polish(self.delta_label)
+        self.delta_label.show()
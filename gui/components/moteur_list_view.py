@@ -0,0 +1,35 @@
+from PySide6.QtWidgets import QListView
+from PySide6.QtCore import QSize, QStringListModel
+from gui.styling import AppStyles
+
+class MoteurListView(QListView):
+    """
+    A read-only, wrapped list of motor names.
+
+    One model-backed view instead of a QLabel per motor; the view wraps
+    the entries into columns and only paints the visible ones.
+    """
+
+    def __init__(self, moteurs, parent=None):
+        super().__init__(parent)
+
+        labels = [f"• {moteur}" for moteur in moteurs]
+        self.setModel(QStringListModel(labels, self))
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setMinimumHeight(150)
+        self.setStyleSheet(f"color: #CCCCCC; background-color: {AppStyles.DARK_CARD_BG}; border: 1px solid {AppStyles.DARK_BORDER};")
+
+        font = self.font()
+        font.setPixelSize(13)
+        self.setFont(font)
+
+        # Size every cell for the longest name so the columns line up
+        if labels:
+            metrics = self.fontMetrics()
+            longest = max(labels, key=len)
+            self.setGridSize(QSize(metrics.horizontalAdvance(longest) + 20, metrics.height() + 6))
@@ -0,0 +1,101 @@
+from functools import lru_cache
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPainter
+
+from gui.styling import AppStyles
+
+# matplotlib is imported inside the functions below so that loading this
+# module (and the analysis page) does not pay for its import and font scan
+
+
+@lru_cache(maxsize=None)
+def chart_font(**properties):
+    """Return a shared FontProperties, resolved once per set of properties."""
+    from matplotlib.font_manager import FontProperties
+    return FontProperties(**properties)
+
+
+class ChartAxesMixin:
+    """Dark mode figure and axes handling shared by the chart canvases."""
+
+    def init_figure(self, width, height, dpi):
+        """Create the figure and its single styled axes."""
+        from matplotlib.figure import Figure
+
+        # Create figure with dark background; constrained layout replaces
+        # a tight-layout solve on every draw
+        self.fig = Figure(figsize=(width, height), dpi=dpi, facecolor=AppStyles.DARK_CARD_BG,
+                          layout="constrained")
+        self.axes = self.fig.add_subplot(111)
+        self.style_axes()
+
+    def style_axes(self):
+        """Apply the dark mode styling to the axes."""
+        self.axes.set_facecolor(AppStyles.DARK_CARD_BG)
+        self.axes.spines['bottom'].set_color(AppStyles.DARK_BORDER)
+        self.axes.spines['top'].set_color(AppStyles.DARK_BORDER)
+        self.axes.spines['left'].set_color(AppStyles.DARK_BORDER)
+        self.axes.spines['right'].set_color(AppStyles.DARK_BORDER)
+        self.axes.tick_params(colors=AppStyles.TEXT_COLOR)
+        self.axes.xaxis.label.set_color(AppStyles.TEXT_COLOR)
+        self.axes.yaxis.label.set_color(AppStyles.TEXT_COLOR)
+        self.axes.title.set_color(AppStyles.TEXT_COLOR)
+
+    def reset_axes(self):
+        """Clear the plot so the canvas can be reused, keeping the styling."""
+        self.axes.clear()
+        self.style_axes()
+
+
+class StaticCanvas(ChartAxesMixin, QWidget):
+    """
+    A non-interactive chart widget: the figure is rendered with plain Agg and
+    blitted with QPainter, without the Qt backend's event plumbing. The
+    rendered image is cached until the chart changes or the widget resizes.
+    """
+
+    def __init__(self, width=5, height=4, dpi=100, parent=None):
+        super().__init__(parent)
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.init_figure(width, height, dpi)
+        self._dpi = dpi
+        self._agg = FigureCanvasAgg(self.fig)
+        self._image = None
+
+        # The rendered image covers every pixel, so Qt need not clear it first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumHeight(300)  # Ensure minimum height for visibility
+
+    def draw_idle(self):
+        """Schedule a re-render of the figure on the next paint."""
+        self._image = None
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._image = None
+
+    def paintEvent(self, event):
+        if self._image is None:
+            self._image = self._render()
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._image)
+        painter.end()
+
+    def _render(self):
+        """Render the figure at the widget's physical size into a QImage."""
+        ratio = self.devicePixelRatioF()
+        self.fig.set_dpi(self._dpi * ratio)
+        self.fig.set_size_inches(max(self.width(), 1) / self._dpi,
+                                 max(self.height(), 1) / self._dpi)
+        self._agg.draw()
+        width, height = self._agg.get_width_height()
+        image = QImage(self._agg.buffer_rgba(), width, height, QImage.Format_RGBA8888).copy()
+        image.setDevicePixelRatio(ratio)
+        return image
@@ -0,0 +1,102 @@
+import os
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals used by background tasks to report back to the GUI thread."""
+
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class AnalysisTask(QRunnable):
+    """Runs the spring change comparison on a QThreadPool worker thread."""
+
+    def __init__(self, old_df, new_df, pta_type):
+        super().__init__()
+        self.old_df = old_df
+        self.new_df = new_df
+        self.pta_type = pta_type
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Generate the results DataFrame and emit it (or the error message)."""
+        # Imported here so pandas loads with the first analysis, not the GUI
+        from data_processing import generate_results_df
+
+        try:
+            result_df = generate_results_df(self.old_df, self.new_df, self.pta_type)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result_df)
+
+
+class ExcelExportTask(QRunnable):
+    """Writes the results report to an Excel file on a QThreadPool worker thread."""
+
+    def __init__(self, results_df, template_path, out_path):
+        super().__init__()
+        self.results_df = results_df
+        self.template_path = template_path
+        self.out_path = out_path
+        # Set by run(): whether the template was highlighted, and why not
+        self.highlighted = False
+        self.highlight_error = None
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Write the report and emit its path (or the error message)."""
+        from utils.file_handler import FileHandler
+
+        try:
+            if self.template_path and os.path.exists(self.template_path):
+                try:
+                    # Use the original file as template
+                    FileHandler.write_excel_to_path(self.results_df, self.template_path, self.out_path)
+                    self.highlighted = True
+                except Exception as e:
+                    # Fall back to simple export
+                    self.highlight_error = str(e)
+                    FileHandler.write_results_excel(self.results_df, self.out_path)
+            else:
+                # Basic export
+                FileHandler.write_results_excel(self.results_df, self.out_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(self.out_path)
+
+
+class ImageDecodeTask(QRunnable):
+    """Decodes (and optionally scales) an encoded image on a QThreadPool worker thread."""
+
+    # Relative size difference below which the image is not resampled
+    SCALE_TOLERANCE = 0.05
+
+    def __init__(self, image_data, size=None):
+        super().__init__()
+        self.image_data = image_data  # PNG/JPEG/... file bytes
+        self.size = size  # (width, height) to scale to, or None for the original size
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Emit the decoded QImage (QPixmap is GUI-thread only) or the error message."""
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QImage
+
+        try:
+            image = QImage.fromData(self.image_data)
+            if image.isNull():
+                raise ValueError("unsupported or corrupt image data")
+            if self.size is not None:
+                target = image.size().scaled(*self.size, Qt.KeepAspectRatio)
+                # Resampling within a few percent of the original size costs a
+                # full filter pass for no visible difference; keep it as is
+                if abs(target.width() - image.width()) > self.SCALE_TOLERANCE * image.width():
+                    image = image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(image)
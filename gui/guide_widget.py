@@ -1,22 +1,67 @@
 import os
+import sys
+from functools import lru_cache
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QFrame, 
                                QHBoxLayout, QPushButton, QSlider, QSizePolicy)
-from PySide6.QtGui import QPixmap, QPainter, QFont
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QFont
 from PySide6.QtCore import QUrl, Qt, QTimer
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 
+from gui.styling import AppStyles
+
+@lru_cache(maxsize=None)
+def find_resource(relative_path):
+    """
+    Return (absolute path, exists) for a resource, works for dev and for PyInstaller.
+
+    Resolved on first use rather than at import, since main.py sets
+    RESOURCE_PATH after this module is loaded; the result (including the
+    existence check) is cached for later guide pages.
+    """
+    # Try to get base path from environment variable first (set by main.py)
+    base_path = os.environ.get('RESOURCE_PATH')
+    
+    if not base_path:
+        # Fallback to direct detection
+        if getattr(sys, 'frozen', False):
+            # Running in PyInstaller bundle
+            base_path = sys._MEIPASS
+        else:
+            # Running in your IDE / as a normal script
+            base_path = os.path.dirname(os.path.abspath(__file__))
+    
+    full_path = os.path.join(base_path, relative_path)
+    print(f"Resource path for '{relative_path}': {full_path}")
+    return full_path, os.path.isfile(full_path)
+
+# Size the guide banner is scaled to for the video overlay
+BANNER_SIZE = (400, 300)
+
+def get_banner_pixmap(banner_path):
+    """
+    Return the banner scaled for the video overlay, or None if it can't be loaded.
+
+    The decoded and scaled pixmap is kept in QPixmapCache, so later guide
+    pages skip the PNG decode and smooth rescale.
+    """
+    cache_key = f"guide_banner_{BANNER_SIZE[0]}x{BANNER_SIZE[1]}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(banner_path)
+    if pixmap.isNull():
+        return None
+    pixmap = pixmap.scaled(*BANNER_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
 class VideoPlayerWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #1a1a1a;
-                border: 2px solid #333;
-                border-radius: 10px;
-            }
-        """)
+        self.setObjectName("guideVideoFrame")
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -35,29 +80,11 @@ class VideoPlayerWidget(QFrame):
         # Initialize media player
         self.setup_media_player()
     
-    def get_resource_path(self, relative_path):
-        """Return absolute path to resource, works for dev and for PyInstaller."""
-        # Try to get base path from environment variable first (set by main.py)
-        base_path = os.environ.get('RESOURCE_PATH')
-        
-        if not base_path:
-            # Fallback to direct detection
-            if getattr(sys, 'frozen', False):
-                # Running in PyInstaller bundle
-                base_path = sys._MEIPASS
-            else:
-                # Running in your IDE / as a normal script
-                base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        full_path = os.path.join(base_path, relative_path)
-        print(f"Resource path for '{relative_path}': {full_path}")
-        return full_path
-        
     def create_banner_section(self, layout):
         """Create simple centered Guide header"""
         title_label = QLabel("Guide")
-        title_label.setFont(QFont("Arial", 32, QFont.Bold))
-        title_label.setStyleSheet("color: white; padding: 20px;")
+        title_label.setFont(AppStyles.font("Arial", 32, QFont.Bold))
+        title_label.setObjectName("guideTitle")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
     
@@ -65,20 +92,14 @@ class VideoPlayerWidget(QFrame):
         """Create the video display section with optional image overlay"""
         # Video container
         video_container = QFrame()
-        video_container.setStyleSheet("""
-            QFrame {
-                background-color: #000;
-                border-radius: 8px;
-                border: 1px solid #444;
-            }
-        """)
+        video_container.setObjectName("guideVideoContainer")
         
         video_layout = QVBoxLayout(video_container)
         video_layout.setContentsMargins(0, 0, 0, 0)
         
         # Create a stacked widget-like container
         video_stack = QFrame()
-        video_stack.setStyleSheet("background: transparent;")
+        video_stack.setObjectName("guideVideoStack")
         stack_layout = QVBoxLayout(video_stack)
         stack_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -90,20 +111,14 @@ class VideoPlayerWidget(QFrame):
         # Image overlay (poster)
         self.image_overlay = QLabel()
         self.image_overlay.setAlignment(Qt.AlignCenter)
-        self.image_overlay.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 200);
-                border-radius: 8px;
-            }
-        """)
+        self.image_overlay.setObjectName("guideImageOverlay")
         
         # Try to load banner image for overlay
-        banner_path = self.get_resource_path("resources/images/guide_banner.png")
-        if os.path.exists(banner_path):
-            pixmap = QPixmap(banner_path)
-            if not pixmap.isNull():
-                # Scale image to fit nicely as an overlay
-                scaled_pixmap = pixmap.scaled(400, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        banner_path, banner_exists = find_resource("resources/images/guide_banner.png")
+        if banner_exists:
+            # Scaled to fit nicely as an overlay
+            scaled_pixmap = get_banner_pixmap(banner_path)
+            if scaled_pixmap is not None:
                 self.image_overlay.setPixmap(scaled_pixmap)
                 self.image_overlay.show()
             else:
@@ -111,15 +126,7 @@ class VideoPlayerWidget(QFrame):
         else:
             # Show play button if no image
             self.image_overlay.setText("▶ Click to Play")
-            self.image_overlay.setStyleSheet("""
-                QLabel {
-                    background-color: rgba(0, 0, 0, 150);
-                    color: white;
-                    font-size: 24px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-            """)
+            self.image_overlay.setProperty("placeholder", True)
         
         # Position overlay on top of video
         stack_layout.addWidget(self.video_widget)
@@ -132,13 +139,7 @@ class VideoPlayerWidget(QFrame):
         """Create video control buttons and progress bar"""
         controls_frame = QFrame()
         controls_frame.setMaximumHeight(60)
-        controls_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border-radius: 8px;
-                border: 1px solid #444;
-            }
-        """)
+        controls_frame.setObjectName("guideControls")
         
         controls_layout = QHBoxLayout(controls_frame)
         controls_layout.setContentsMargins(15, 10, 15, 10)
@@ -146,51 +147,18 @@ class VideoPlayerWidget(QFrame):
         # Play/Pause button
         self.play_button = QPushButton("▶")
         self.play_button.setFixedSize(40, 40)
-        self.play_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 20px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5ba0f2;
-            }
-            QPushButton:pressed {
-                background-color: #3a80d2;
-            }
-        """)
+        self.play_button.setObjectName("guidePlayButton")
         self.play_button.clicked.connect(self.toggle_playback)
         controls_layout.addWidget(self.play_button)
         
         # Progress slider
         self.progress_slider = QSlider(Qt.Horizontal)
-        self.progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: 1px solid #444;
-                height: 8px;
-                background: #333;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #4a90e2;
-                border: 1px solid #4a90e2;
-                width: 18px;
-                border-radius: 9px;
-                margin: -5px 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4a90e2;
-                border-radius: 4px;
-            }
-        """)
+        self.progress_slider.setObjectName("guideProgressSlider")
         controls_layout.addWidget(self.progress_slider)
         
         # Time label
         self.time_label = QLabel("00:00 / 00:00")
-        self.time_label.setStyleSheet("color: #ccc; margin-left: 10px;")
+        self.time_label.setObjectName("guideTimeLabel")
         self.time_label.setMinimumWidth(100)
         controls_layout.addWidget(self.time_label)
         
@@ -203,6 +171,15 @@ class VideoPlayerWidget(QFrame):
         self.media_player.setAudioOutput(self.audio_output)
         self.media_player.setVideoOutput(self.video_widget)
         
+        # positionChanged fires every few tens of ms; the slider and time label
+        # are refreshed at most every 250 ms from the latest position instead
+        self._pos_ms = 0
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.setInterval(250)
+        self._pos_timer.timeout.connect(self._flush_position)
+        self._last_time_key = (-1, -1)  # (position, duration) in whole seconds shown
+        
         # Connect signals
         self.media_player.positionChanged.connect(self.update_position)
         self.media_player.durationChanged.connect(self.update_duration)
@@ -212,11 +189,11 @@ class VideoPlayerWidget(QFrame):
         self.media_player.playbackStateChanged.connect(self.on_playback_state_changed)
         
         # Load video file
-        video_path = self.get_resource_path("video/intro.mp4")
+        video_path, video_exists = find_resource("video/intro.mp4")
         print(f"Looking for video at: {video_path}")
-        print(f"Video file exists: {os.path.exists(video_path)}")
+        print(f"Video file exists: {video_exists}")
         
-        if os.path.exists(video_path):
+        if video_exists:
             self.media_player.setSource(QUrl.fromLocalFile(video_path))
             print("Video loaded successfully")
         else:
@@ -227,15 +204,7 @@ class VideoPlayerWidget(QFrame):
         """Display error message when video cannot be loaded"""
         error_label = QLabel(message)
         error_label.setAlignment(Qt.AlignCenter)
-        error_label.setStyleSheet("""
-            QLabel {
-                color: #ff6b6b;
-                font-size: 14px;
-                background-color: #1a1a1a;
-                padding: 20px;
-                border-radius: 8px;
-            }
-        """)
+        error_label.setObjectName("guideVideoError")
         
         # Replace video widget with error label temporarily
         layout = self.video_widget.parent().layout()
@@ -251,13 +220,21 @@ class VideoPlayerWidget(QFrame):
             self.media_player.play()
             self.play_button.setText("⏸")
             # Hide image overlay when video starts playing
-            if hasattr(self, 'image_overlay'):
-                self.image_overlay.hide()
+            self.image_overlay.hide()
     
     def update_position(self, position):
+        """Record the playback position; the display catches up on the next flush"""
+        self._pos_ms = position
+        # Throttle rather than debounce: a running timer is not restarted
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+    
+    def _flush_position(self):
         """Update progress slider position"""
-        self.progress_slider.setValue(position)
-        self.update_time_label(position, self.media_player.duration())
+        if self.progress_slider.value() == self._pos_ms:
+            return
+        self.progress_slider.setValue(self._pos_ms)
+        self.update_time_label(self._pos_ms, self.media_player.duration())
     
     def update_duration(self, duration):
         """Update progress slider range"""
@@ -269,21 +246,20 @@ class VideoPlayerWidget(QFrame):
         self.media_player.setPosition(position)
     
     def update_time_label(self, position, duration):
-        """Update time display"""
-        def format_time(ms):
-            s = ms // 1000
-            m, s = divmod(s, 60)
-            return f"{m:02d}:{s:02d}"
+        """Update time display, only when the shown seconds change"""
+        key = (position // 1000, duration // 1000)
+        if key == self._last_time_key:
+            return
+        self._last_time_key = key
         
-        current_time = format_time(position)
-        total_time = format_time(duration)
-        self.time_label.setText(f"{current_time} / {total_time}")
+        pos_s, dur_s = key
+        self.time_label.setText(f"{pos_s // 60:02d}:{pos_s % 60:02d} / {dur_s // 60:02d}:{dur_s % 60:02d}")
     
     def on_playback_state_changed(self, state):
         """Handle playback state changes"""
-        if state == QMediaPlayer.PlayingState and hasattr(self, 'image_overlay'):
+        if state == QMediaPlayer.PlayingState:
             self.image_overlay.hide()
-        elif state == QMediaPlayer.StoppedState and hasattr(self, 'image_overlay'):
+        elif state == QMediaPlayer.StoppedState:
             self.image_overlay.show()
 
 
@@ -299,10 +275,5 @@ class GuideWidget(QWidget):
         self.video_player = VideoPlayerWidget()
         layout.addWidget(self.video_player)
         
-        # Set background style
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                color: white;
-            }
-        """)
\ No newline at end of file
+        # One stylesheet for the whole page, scoped by objectName
+        self.setStyleSheet(AppStyles.GUIDE_WIDGET_QSS)
@@ -5,9 +5,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon, QPixmap, QFont
 
-from gui.upload_widget import UploadWidget
-from gui.analysis_widget import AnalysisWidget
-from gui.results_widget import ResultsWidget
 from gui.guide_widget import GuideWidget
 from utils.app_state import AppState
 from gui.styling import AppStyles
@@ -15,6 +12,9 @@ from gui.styling import AppStyles
 class MainWindow(QMainWindow):
     """Main application window for the Spring Change Detection app."""
     
+    # Attribute holding the page of each workflow step (stack index = step + 1)
+    PAGE_ATTRIBUTES = ("upload_widget", "analysis_widget", "results_widget")
+    
     def __init__(self, state: AppState):
         super().__init__()
         
@@ -31,8 +31,7 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon("resources/icons/car_icon.png"))
         self.setMinimumSize(1200, 800)
         
-        # Apply dark mode style
-        self.setStyleSheet(AppStyles.DARK_MODE_STYLE)
+        # Dark mode comes from the application-wide stylesheet set in main()
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -51,13 +50,13 @@ class MainWindow(QMainWindow):
         
         # Add title to sidebar
         sidebar_title = QLabel("🚗 Spring Change Detection")
-        sidebar_title.setFont(QFont("Arial", 14, QFont.Bold))
+        sidebar_title.setFont(AppStyles.font("Arial", 14, QFont.Bold))
         sidebar_title.setStyleSheet(AppStyles.SIDEBAR_TITLE_STYLE)
         sidebar_layout.addWidget(sidebar_title)
         
         # Add workflow section
         workflow_label = QLabel("🚀 Project Workflow")
-        workflow_label.setFont(QFont("Arial", 12, QFont.Bold))
+        workflow_label.setFont(AppStyles.font("Arial", 12, QFont.Bold))
         workflow_label.setStyleSheet(AppStyles.SIDEBAR_TITLE_STYLE)
         sidebar_layout.addWidget(workflow_label)
         
@@ -77,7 +76,7 @@ class MainWindow(QMainWindow):
         
         # Add about section
         about_label = QLabel("ℹ️ About Project")
-        about_label.setFont(QFont("Arial", 12, QFont.Bold))
+        about_label.setFont(AppStyles.font("Arial", 12, QFont.Bold))
         about_label.setStyleSheet(AppStyles.SIDEBAR_TITLE_STYLE)
         sidebar_layout.addWidget(about_label)
         
@@ -99,17 +98,17 @@ class MainWindow(QMainWindow):
         # Create main content area with stacked widget
         self.content_widget = QStackedWidget()
         
-        # Create pages
+        # Create pages; the guide is shown first, the workflow pages (and
+        # their pandas/matplotlib imports) are built on first navigation
         self.guide_widget = GuideWidget(self)
-        self.upload_widget = UploadWidget(self.state, self)
-        self.analysis_widget = AnalysisWidget(self.state, self)
-        self.results_widget = ResultsWidget(self.state, self)
+        self.upload_widget = None
+        self.analysis_widget = None
+        self.results_widget = None
         
-        # Add pages to stack
+        # Add pages to stack, with placeholders for the workflow pages
         self.content_widget.addWidget(self.guide_widget)
-        self.content_widget.addWidget(self.upload_widget)
-        self.content_widget.addWidget(self.analysis_widget)
-        self.content_widget.addWidget(self.results_widget)
+        for _ in self.PAGE_ATTRIBUTES:
+            self.content_widget.addWidget(QWidget())
         
         # Add widgets to splitter
         splitter.addWidget(sidebar_frame)
@@ -128,24 +127,63 @@ class MainWindow(QMainWindow):
         self.content_widget.setCurrentIndex(0)  # Show guide first
         self.update_workflow_buttons(-1)  # Highlight guide button
     
+    def get_page(self, step_index):
+        """Return the page of a workflow step, building it on first use."""
+        attribute = self.PAGE_ATTRIBUTES[step_index]
+        page = getattr(self, attribute)
+        if page is None:
+            page = self.create_page(step_index)
+            setattr(self, attribute, page)
+            
+            # Swap the placeholder for the real page
+            placeholder = self.content_widget.widget(step_index + 1)
+            self.content_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.content_widget.insertWidget(step_index + 1, page)
+        return page
+    
+    def create_page(self, step_index):
+        """Import and construct the page of a workflow step."""
+        if step_index == 0:
+            from gui.upload_widget import UploadWidget
+            return UploadWidget(self.state, self)
+        if step_index == 1:
+            from gui.analysis_widget import AnalysisWidget
+            page = AnalysisWidget(self.state, self)
+            # Analysis finishes asynchronously; refresh the sidebar when it does
+            page.analysis_completed.connect(self.on_analysis_completed, Qt.DirectConnection)
+            return page
+        from gui.results_widget import ResultsWidget
+        return ResultsWidget(self.state, self)
+    
     def create_workflow_button(self, text, index):
         """Create a styled workflow button."""
         button = QPushButton(text)
         button.setMinimumHeight(40)
         button.setCheckable(True)
-        button.clicked.connect(lambda: self.on_workflow_button_clicked(index))
+        # One shared slot; the step is read back from the clicked button
+        button.setProperty("workflow_index", index)
+        button.clicked.connect(self._on_workflow_button_sender_clicked)
         return button
     
+    def _on_workflow_button_sender_clicked(self):
+        """Dispatch a workflow button click on the button's step index."""
+        self.on_workflow_button_clicked(self.sender().property("workflow_index"))
+    
     def on_workflow_button_clicked(self, index):
         """Handle workflow button clicks."""
+        self._goto(index)
+    
+    def _goto(self, step_index):
+        """Show a workflow step (-1 for the guide), if its prerequisites are met."""
         # Special case for guide page
-        if index == -1:
-            self.content_widget.setCurrentIndex(0)  # Show guide page
-            self.update_workflow_buttons(index)
+        if step_index == -1:
+            self.content_widget.setCurrentWidget(self.guide_widget)
+            self.update_workflow_buttons(step_index)
             return
             
-        # Check if we can navigate to the selected page
-        if index == 1:  # Analysis
+        # Handle step restrictions
+        if step_index == 1:  # Analysis
             if self.state.old_df is None or self.state.new_df is None:
                 QMessageBox.warning(
                     self,
@@ -155,10 +193,9 @@ class MainWindow(QMainWindow):
                 return  # Can't go to analysis without files
             
             # When navigating to analysis, automatically run the analysis
-            if hasattr(self.content_widget.widget(index+1), 'run_analysis'):  # +1 because guide is at index 0
-                self.content_widget.widget(index+1).run_analysis()
+            self.get_page(step_index).run_analysis()
         
-        if index == 2:  # Results
+        elif step_index == 2:  # Results
             if not self.state.analysis_completed:
                 QMessageBox.warning(
                     self,
@@ -167,13 +204,16 @@ class MainWindow(QMainWindow):
                 )
                 return  # Can't go to results without analysis
         
-        
         # Update current step
-        self.state.current_step = index
+        self.state.current_step = step_index
         
-        # Update UI - Add 1 to account for guide page
-        self.content_widget.setCurrentIndex(index+1)
-        self.update_workflow_buttons(index)
+        # Show the page by reference rather than by stack index
+        self.content_widget.setCurrentWidget(self.get_page(step_index))
+        self.update_workflow_buttons(step_index)
+    
+    def on_analysis_completed(self):
+        """Mark the analysis step as completed in the sidebar."""
+        self.update_workflow_buttons(self.state.current_step)
     
     def update_workflow_buttons(self, active_index):
         """Update the appearance of workflow buttons based on current state."""
@@ -207,46 +247,7 @@ class MainWindow(QMainWindow):
         print(f"Navigating to step: {step_index}")  # Debug print
         
         try:
-            # Special case for guide page
-            if step_index == -1:  # Guide
-                self.content_widget.setCurrentIndex(0)
-                self.update_workflow_buttons(step_index)
-                return
-                
-            # Handle step restrictions
-            if step_index == 1:  # Analysis
-                if self.state.old_df is None or self.state.new_df is None:
-                    QMessageBox.warning(
-                        self,
-                        "Missing Files",
-                        "Please upload both old and new PTA files before proceeding to analysis."
-                    )
-                    return
-                
-                # Run analysis on the analysis widget
-                analysis_widget = self.content_widget.widget(step_index + 1)
-                if hasattr(analysis_widget, 'run_analysis'):
-                    analysis_widget.run_analysis()
-                    
-            elif step_index == 2:  # Results
-                if not self.state.analysis_completed:
-                    QMessageBox.warning(
-                        self,
-                        "Analysis Required",
-                        "Please complete the analysis before viewing results."
-                    )
-                    return
-                    
-            
-            # Update state
-            self.state.current_step = step_index
-            
-            # Set visible widget (+1 because guide is at index 0)
-            self.content_widget.setCurrentIndex(step_index + 1)
-            
-            # Update buttons
-            self.update_workflow_buttons(step_index)
-            
+            self._goto(step_index)
         except Exception as e:
             print(f"Error in navigation: {str(e)}")
             QMessageBox.critical(self, "Navigation Error", f"An error occurred while navigating: {str(e)}")
@@ -1,53 +1,107 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QTabWidget, QTableView, QHeaderView, QFileDialog, QMessageBox,
-    QScrollArea, QSizePolicy, QApplication
+    QScrollArea, QSizePolicy, QApplication, QProgressDialog
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
-from PySide6.QtGui import QFont, QColor, QBrush
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThreadPool
+from PySide6.QtGui import QFont, QColor, QBrush, QPixmap, QPixmapCache
 
+import numpy as np
 import pandas as pd
 import os
+from functools import partial
 import io
 from openpyxl import load_workbook
 
 from utils.app_state import AppState
 from utils.file_handler import FileHandler
-from gui.components.excel_table_model import DataFrameModel
+from gui.components.excel_table_model import DataFrameModel, use_fixed_row_height, sort_on_header_click
+from gui.components.moteur_list_view import MoteurListView
+from gui.components.workers import ExcelExportTask, ImageDecodeTask
 from gui.styling import AppStyles
 
+# Sheet-name fragments (lowercase) marking the "Assiette théorique" sheet
+ASSIETTE_TOKENS = ("assiette", "théorique", "theorique")
+
+def is_assiette_sheet(sheet_name):
+    """Return whether a sheet is the special "Assiette théorique" sheet."""
+    lowered = sheet_name.lower()
+    return any(token in lowered for token in ASSIETTE_TOKENS)
+
+# Room, in KB, that QPixmapCache gets for decoded charts (Qt's default is 10 MB)
+CHART_CACHE_LIMIT_KB = 64 * 1024
+
+# Results column widths: first token found in the lowercased column name wins
+COL_WIDTH_RULES = (
+    ("reference", 180), ("référence", 180),
+    ("masse", 100), ("mass", 100),
+    ("change", 150), ("status", 150),
+)
+DEFAULT_COL_WIDTH = 120
+
+def column_widths(column_names):
+    """Return the width of each results column, classified by name."""
+    widths = []
+    for name in column_names:
+        lowered = str(name).lower()
+        widths.append(next((width for token, width in COL_WIDTH_RULES if token in lowered), DEFAULT_COL_WIDTH))
+    return widths
+
 class ColoredDataFrameModel(DataFrameModel):
     """Extended DataFrameModel with row coloring based on change type."""
     
+    # Map of Change Type to colors
+    color_map = {
+        "New": QColor("#FF5733"),        # Red for new cars
+        "Spring Changed": QColor("#CDA000"),  # Custom yellow for changed cars
+    }
+    # Make text white for red background for readability
+    text_color_map = {
+        "New": QBrush(QColor("white")),
+    }
+    
     def __init__(self, data=None):
         super().__init__(data)
-        # Map of Change Type to colors
-        self.color_map = {
-            "New": QColor("#FF5733"),        # Red for new cars
-            "Spring Changed": QColor("#CDA000"),  # Custom yellow for changed cars
-        }
-    
-    def data(self, index, role=Qt.DisplayRole):
-        """Get data at the given index with additional styling."""
-        if role == Qt.BackgroundRole:
-            # Apply highlighting based on Change Type column
-            if index.isValid() and "Change Type" in self.dataframe.columns:
-                row = index.row()
-                change_type = self.dataframe.iloc[row]["Change Type"]
-                
-                if change_type in self.color_map:
-                    return self.color_map[change_type]
-            
-        elif role == Qt.ForegroundRole:
-            # Make text white for red background for readability
-            if index.isValid() and "Change Type" in self.dataframe.columns:
-                row = index.row()
-                change_type = self.dataframe.iloc[row]["Change Type"]
-                
-                if change_type == "New":
-                    return QBrush(QColor("white"))
-        
-        return super().data(index, role)
+        # Row colors go through the same role dispatch as the base roles, so
+        # unhandled roles still return None after one dict lookup
+        self._role_handlers[Qt.BackgroundRole] = self._background_data
+        self._role_handlers[Qt.ForegroundRole] = self._foreground_data
+    
+    def _set_dataframe(self, frame):
+        """Store the frame, with each data row's colors looked up once."""
+        super()._set_dataframe(frame)
+        if "Change Type" in self._df.columns:
+            change_types = self._df["Change Type"].astype("category")
+            categories = change_types.cat.categories
+            codes = change_types.cat.codes.to_numpy()
+        else:
+            categories = []
+            codes = np.full(len(self._df), -1, dtype=np.int8)
+        # Colors per category (plus None for missing, at code -1), then one
+        # take over the codes gives every row's color
+        self._backgrounds = self._palette(self.color_map, categories)[codes]
+        self._foregrounds = self._palette(self.text_color_map, categories)[codes]
+    
+    def _permute_rows(self, permutation):
+        """Reorder the row colors along with the cells."""
+        super()._permute_rows(permutation)
+        self._backgrounds = self._backgrounds[permutation]
+        self._foregrounds = self._foregrounds[permutation]
+    
+    @staticmethod
+    def _palette(colors, categories):
+        """Object array of each category's color, with a trailing None for code -1."""
+        palette = np.empty(len(categories) + 1, dtype=object)
+        for i, category in enumerate(categories):
+            palette[i] = colors.get(category)
+        return palette
+    
+    # Row 0 is the header row, so data row r is at array position r - 1
+    def _background_data(self, row, col):
+        return self._backgrounds[row - 1] if row > 0 else None
+    
+    def _foreground_data(self, row, col):
+        return self._foregrounds[row - 1] if row > 0 else None
 
 
 class ResultsWidget(QWidget):
@@ -57,34 +111,50 @@ class ResultsWidget(QWidget):
         super().__init__(parent)
         self.state = state
         self.image_max_width = 800  # Maximum width for displayed images
+        self._export_task = None  # In-flight ExcelExportTask, if any
+        self._export_progress = None
+        self._rendered_version = -1  # state.results_version the tabs were built from
+        self._tab_builders = {}  # Placeholder page -> builder of its content
+        self._display_cache = None  # (state.results_version, merged display DataFrame)
+        # Tables are built once and then fed new data
+        self.results_tab = None
+        self.results_table_view = None
+        self.results_model = None
+        self._results_source = None  # DataFrame results_model was last given
+        self._sheet_tabs = {}  # Sheet name -> (tab, model or None, sheet loader shown)
+        self._sheet_groups = None  # sheet_groups() result
+        self._sheet_groups_source = None  # excel_sheets_data it was computed from
+        # Decoded charts go to QPixmapCache, an LRU bounded by pixel memory
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), CHART_CACHE_LIMIT_KB))
+        self._decode_tasks = set()  # In-flight ImageDecodeTasks, kept alive until they report
         self.init_ui()
         
-        # Update results when the widget is created
-        if self.state.results_df is not None:
-            self.update_results()
+        # Build the initial tabs (the only build when results already exist)
+        self.refresh_if_changed()
     
     def showEvent(self, event):
         """Handle widget becoming visible."""
         super().showEvent(event)
         # Update results when the widget becomes visible
-        if self.state.results_df is not None:
-            self.update_results()
+        self.refresh_if_changed()
+    
+    def refresh_if_changed(self):
+        """Rebuild the tabs only if the results changed since they were built."""
+        # Also runs without results, to show the "no results" message
+        if self.state.results_version == self._rendered_version:
+            return
+        self.update_results()
+        # Read after the update, which may itself load the Excel sheets
+        self._rendered_version = self.state.results_version
     
     def create_moteur_list_tab(self):
         """Create a tab showing the list of unique motors (Moteur column)."""
-        # Check if Moteur column exists in any dataset
-        moteurs = []
-        
-        # Check new file
-        if self.state.new_df is not None and "Moteur" in self.state.new_df.columns:
-            moteurs.extend(self.state.new_df["Moteur"].dropna().unique())
-        
-        # Check old file
-        if self.state.old_df is not None and "Moteur" in self.state.old_df.columns:
-            moteurs.extend(self.state.old_df["Moteur"].dropna().unique())
+        # Sorted, non-empty motor names from both datasets
+        from data_processing import unique_moteurs
+        moteurs = unique_moteurs(self.state.new_df, self.state.old_df)
         
         # If no Moteur columns found, return None
-        if not moteurs:
+        if len(moteurs) == 0:
             return None
             
         # Create tab
@@ -93,61 +163,30 @@ class ResultsWidget(QWidget):
         
         # Header
         moteur_list_label = QLabel("🔧 Unique Motors List")
-        moteur_list_label.setFont(QFont("Arial", 14, QFont.Bold))
+        moteur_list_label.setFont(AppStyles.font("Arial", 14, QFont.Bold))
         moteur_list_label.setStyleSheet("color: white; margin-bottom: 10px;")
         layout.addWidget(moteur_list_label)
         
-        # Get sorted unique motors (remove duplicates)
-        unique_moteurs = sorted(set(moteurs))
-        
         # Display count
-        count_label = QLabel(f"Found {len(unique_moteurs)} unique motor types")
+        count_label = QLabel(f"Found {len(moteurs)} unique motor types")
         count_label.setStyleSheet("color: #CCCCCC; font-style: italic; margin-bottom: 10px;")
         layout.addWidget(count_label)
 
-        # Display as a scrollable label list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-
-        # Create a grid layout for better organization of motor names
-        grid_layout = QGridLayout()
-        grid_layout.setHorizontalSpacing(20)
-        grid_layout.setVerticalSpacing(5)
-        
-        # Calculate number of columns based on typical length of motor names
-        num_columns = 2  # Adjust based on typical width
-        
-        # Add motors to grid
-        for i, moteur in enumerate(unique_moteurs):
-            if moteur and str(moteur).strip():  # Skip empty values
-                row = i // num_columns
-                col = i % num_columns
-                
-                moteur_label = QLabel(f"• {moteur}")
-                moteur_label.setStyleSheet("color: #CCCCCC; font-size: 13px; padding: 2px;")
-                grid_layout.addWidget(moteur_label, row, col)
-
-        scroll_layout.addLayout(grid_layout)
-        scroll_layout.addStretch()
-        scroll_content.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_content)
-        layout.addWidget(scroll_area)
+        # Virtualized list: only the visible names are painted
+        layout.addWidget(MoteurListView(moteurs))
 
         return tab
     
     def init_ui(self):
         """Initialize the user interface."""
-        # Apply dark mode style
-        self.setStyleSheet(AppStyles.DARK_MODE_STYLE)
+        # Dark mode comes from the application-wide stylesheet set in main()
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Header
         header_label = QLabel("📊 Step 3: Analysis Results")
-        header_label.setFont(QFont("Arial", 16, QFont.Bold))
+        header_label.setFont(AppStyles.font("Arial", 16, QFont.Bold))
         header_label.setStyleSheet(f"color: white; background-color: {AppStyles.PRIMARY_COLOR}; padding: 8px; border-radius: 4px;")
         layout.addWidget(header_label)
         
@@ -185,6 +224,8 @@ class ResultsWidget(QWidget):
             }}
         """)
         
+        # Tab contents are built the first time each tab is shown
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
         
         # Download button
@@ -212,7 +253,7 @@ class ResultsWidget(QWidget):
         legend_layout = QVBoxLayout(legend_frame)
         
         legend_title = QLabel("Color Legend:")
-        legend_title.setFont(QFont("Arial", 10, QFont.Bold))
+        legend_title.setFont(AppStyles.font("Arial", 10, QFont.Bold))
         legend_title.setStyleSheet("color: white;")
         legend_layout.addWidget(legend_title)
         
@@ -225,14 +266,12 @@ class ResultsWidget(QWidget):
         legend_layout.addWidget(changed_legend)
         
         layout.addWidget(legend_frame)
-        
-        # Initialize tabs
-        self.update_results()
     
     def update_results(self):
         """Update the UI with results data following Streamlit tab structure."""
         # Clear all existing tabs
         self.tabs.clear()
+        self._tab_builders.clear()
         
         if self.state.results_df is None:
             # No results available
@@ -246,53 +285,92 @@ class ResultsWidget(QWidget):
             self.tabs.addTab(no_results_tab, "Analysis Results")
             return
         
-        # Load Excel data if available and not already loaded
-        if self.state.new_file_path and not self.state.excel_sheets_data:
+        # Load Excel data if available and not already loaded from this file
+        if self.state.new_file_path and self.state.excel_data_source != self._excel_source():
             self.load_excel_data()
         
         # Tab order: Analysis Results, Data Sheets, Assiette Graphs
         
         # Tab 1: Analysis Results
-        results_tab = self.create_analysis_results_tab()
-        self.tabs.addTab(results_tab, "Analysis Results")
+        self._add_lazy_tab("Analysis Results", self.create_analysis_results_tab)
         
         # Find Assiette théorique sheet first
-        last_sheet = None
-        for sheet_name in self.state.excel_sheets_data.keys():
-            if any(s in sheet_name.lower() for s in ["assiette", "théorique", "theorique"]):
-                last_sheet = sheet_name
-                break
+        last_sheet = self.sheet_groups()[0]
         
         # If found, add its graphs tab right after results
         if last_sheet:
             last_sheet_graphs = f"{last_sheet} Graphs"
             if last_sheet_graphs in self.state.excel_graphs_data:
-                graphs_tab = self.create_sheet_graphs_tab(last_sheet, self.state.excel_graphs_data[last_sheet_graphs])
-                self.tabs.addTab(graphs_tab, f"{last_sheet} Graphs")
+                self._add_lazy_tab(f"{last_sheet} Graphs", partial(
+                    self.create_sheet_graphs_tab, last_sheet, self.state.excel_graphs_data[last_sheet_graphs]))
         
         # Tab 2: Entete (if available)
         if "Entete" in self.state.excel_sheets_data:
-            entete_tab = self.create_sheet_tab("Entete", self.state.excel_sheets_data["Entete"])
-            self.tabs.addTab(entete_tab, "Entete")
+            self._add_lazy_tab("Entete", partial(
+                self.create_sheet_tab, "Entete", self.state.excel_sheets_data["Entete"]))
         
         # Tab 3: Options (if available)
         if "Options" in self.state.excel_sheets_data:
-            options_tab = self.create_sheet_tab("Options", self.state.excel_sheets_data["Options"])
-            self.tabs.addTab(options_tab, "Options")
+            self._add_lazy_tab("Options", partial(
+                self.create_sheet_tab, "Options", self.state.excel_sheets_data["Options"]))
         
         # Tab 4: Assiette théorique (if available)
         if last_sheet:
-            sheet_tab = self.create_sheet_tab(last_sheet, self.state.excel_sheets_data[last_sheet])
-            self.tabs.addTab(sheet_tab, "Assiette Théorique")
+            self._add_lazy_tab("Assiette Théorique", partial(
+                self.create_sheet_tab, last_sheet, self.state.excel_sheets_data[last_sheet]))
     
-        # Tab 5: Moteur List (if available in any dataset)
+        # Tab 5: Moteur List (if available in any dataset); built upfront
+        # since whether it exists depends on its content
         moteur_tab = self.create_moteur_list_tab()
         if moteur_tab:
             self.tabs.addTab(moteur_tab, "Moteur List")
     
+    def sheet_groups(self):
+        """
+        Return (first Assiette sheet or None, sheets other than PTA with
+        Assiette sheets last), classified once per loaded workbook.
+        """
+        sheets = self.state.excel_sheets_data
+        if self._sheet_groups_source is not sheets:
+            assiette_sheets = [name for name in sheets if is_assiette_sheet(name)]
+            regular_sheets = [
+                name for name in sheets
+                if name.upper() != "PTA" and name not in assiette_sheets
+            ]
+            special_sheets = [name for name in assiette_sheets if name.upper() != "PTA"]
+            self._sheet_groups = (
+                assiette_sheets[0] if assiette_sheets else None,
+                regular_sheets + special_sheets,
+            )
+            self._sheet_groups_source = sheets
+        return self._sheet_groups
+    
+    def _add_lazy_tab(self, title, builder):
+        """Add a tab whose content is created by builder() when first shown."""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_builders[placeholder] = builder
+        self.tabs.addTab(placeholder, title)
+    
+    def _on_tab_changed(self, index):
+        """Build the content of a lazily created tab on its first display."""
+        placeholder = self.tabs.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is not None:
+            placeholder.layout().addWidget(builder())
+    
+    def _excel_source(self):
+        """Return (path, modification time) of the new file, or None if it is missing."""
+        path = self.state.new_file_path
+        if not path or not os.path.exists(path):
+            return None
+        return path, os.path.getmtime(path)
+    
     def load_excel_data(self):
         """Load Excel sheet data in background."""
-        if not self.state.new_file_path or not os.path.exists(self.state.new_file_path):
+        source = self._excel_source()
+        if source is None:
             return
             
         try:
@@ -300,19 +378,28 @@ class ResultsWidget(QWidget):
             sheets_data, graphs_data = FileHandler.extract_sheets_and_graphs(self.state.new_file_path)
             self.state.excel_sheets_data = sheets_data
             self.state.excel_graphs_data = graphs_data
+            self.state.excel_data_source = source
             QApplication.restoreOverrideCursor()
         except Exception as e:
             QApplication.restoreOverrideCursor()
             print(f"Could not extract Excel data: {str(e)}")
     
     def create_analysis_results_tab(self):
-        """Create the analysis results tab with highlighting."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
+        """Create the analysis results tab with highlighting, or refresh the existing one."""
         # Prepare display data
         display_df = self.prepare_display_data()
         
+        if self.results_tab is not None:
+            # Keep the view (and its scroll/selection); only swap the data
+            if self._results_source is not display_df:
+                self.results_model.update_dataframe(display_df)
+                self._results_source = display_df
+                self.set_results_column_widths()
+            return self.results_tab
+        
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
         # Create table view with colored model - more compact
         table_view = QTableView()
         table_view.setMinimumHeight(250)
@@ -323,36 +410,46 @@ class ResultsWidget(QWidget):
         # Set up the model with display data
         model = ColoredDataFrameModel(display_df)
         table_view.setModel(model)
+        use_fixed_row_height(table_view)
         
         # Configure column widths
         table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         
-        # Set reasonable default widths
-        for col in range(model.columnCount()):
-            if col < len(model.dataframe.columns):
-                col_name = model.dataframe.columns[col]
-                
-                if 'reference' in col_name.lower() or 'référence' in col_name.lower():
-                    table_view.setColumnWidth(col, 180)
-                elif 'masse' in col_name.lower() or 'mass' in col_name.lower():
-                    table_view.setColumnWidth(col, 100)
-                elif 'change' in col_name.lower() or 'status' in col_name.lower():
-                    table_view.setColumnWidth(col, 150)
-                else:
-                    table_view.setColumnWidth(col, 120)
+        self.results_tab = tab
+        self.results_table_view = table_view
+        self.results_model = model
+        self._results_source = display_df
+        self.set_results_column_widths()
         
-        table_view.setSortingEnabled(True)
+        sort_on_header_click(table_view)
         layout.addWidget(table_view)
         
         return tab
     
+    def set_results_column_widths(self):
+        """Set reasonable default widths for the results table columns."""
+        model = self.results_model
+        # One repaint for the whole pass instead of one per resized column
+        self.results_table_view.setUpdatesEnabled(False)
+        try:
+            self._apply_results_column_widths(model)
+        finally:
+            self.results_table_view.setUpdatesEnabled(True)
+    
+    def _apply_results_column_widths(self, model):
+        """Size each results column by its name."""
+        names = [model.headerData(col, Qt.Horizontal) for col in range(model.columnCount())]
+        for col, width in enumerate(column_widths(names)):
+            self.results_table_view.setColumnWidth(col, width)
+    
     def prepare_display_data(self):
         """Prepare display data by merging new data with results metadata."""
         if self.state.new_df is None or self.state.results_df is None:
             return self.state.results_df if self.state.results_df is not None else pd.DataFrame()
         
-        # Create display dataframe starting with new data
-        display_df = self.state.new_df.copy()
+        # Reuse the merge while the data it was built from is unchanged
+        if self._display_cache is not None and self._display_cache[0] == self.state.results_version:
+            return self._display_cache[1]
         
         # Add metadata columns from results
         metadata_cols = [
@@ -361,55 +458,67 @@ class ResultsWidget(QWidget):
             'Cell ID New', 'Cell ID Old'
         ]
         
-        # Add metadata columns that exist in results
-        for col in metadata_cols:
-            if col in self.state.results_df.columns:
-                if len(display_df) == len(self.state.results_df):
-                    display_df[col] = self.state.results_df[col].values
-        
-        # Sort by Cell ID New for consistent display
-        if 'Cell ID New' in display_df.columns:
-            display_df = display_df.sort_values('Cell ID New', ascending=True).reset_index(drop=True)
-        
+        # Add metadata columns that exist in results (rows are matched by position)
+        base = self.state.new_df
+        if len(base) == len(self.state.results_df):
+            cols = [col for col in metadata_cols if col in self.state.results_df.columns]
+        else:
+            cols = []
+        
+        # Join the columns side by side without copying the new data; results
+        # values replace any new-data column of the same name
+        extra = self.state.results_df[cols]
+        extra.index = base.index
+        overlap = base.columns.intersection(cols)
+        if len(overlap):
+            base = base.drop(columns=overlap)
+        display_df = pd.concat([base, extra], axis=1, copy=False)
+        
+        # Sort by Cell ID New for consistent display; the analysis already
+        # returns results in that order, in which case no gather is needed
+        if 'Cell ID New' in display_df.columns and not display_df['Cell ID New'].is_monotonic_increasing:
+            order = np.argsort(display_df['Cell ID New'].to_numpy(), kind='stable')
+            display_df = display_df.take(order).reset_index(drop=True)
+        
+        self._display_cache = (self.state.results_version, display_df)
         return display_df
     
 
     def add_other_sheets_tabs(self):
         """Add tabs for other sheets and their graphs."""
-        # Get sheet names excluding PTA
-        sheet_names = [name for name in self.state.excel_sheets_data.keys() if name.upper() != "PTA"]
-        
-        # Sort sheets - put "Assiette théorique" at the end
-        regular_sheets = []
-        special_sheets = []
-        
-        for sheet_name in sheet_names:
-            if any(special in sheet_name.lower() for special in ["assiette", "théorique", "theorique"]):
-                special_sheets.append(sheet_name)
-            else:
-                regular_sheets.append(sheet_name)
-        
-        # Add regular sheets first, then special sheets
-        ordered_sheets = regular_sheets + special_sheets
+        # Sheets excluding PTA, with "Assiette théorique" at the end
+        _, ordered_sheets = self.sheet_groups()
         
         for sheet_name in ordered_sheets:
             # Create sheet data tab
-            sheet_tab = self.create_sheet_tab(sheet_name, self.state.excel_sheets_data[sheet_name])
-            self.tabs.addTab(sheet_tab, sheet_name)
+            self._add_lazy_tab(sheet_name, partial(
+                self.create_sheet_tab, sheet_name, self.state.excel_sheets_data[sheet_name]))
             
             # Add graphs tab if available
             graph_key = f"{sheet_name} Graphs"
             if graph_key in self.state.excel_graphs_data:
-                graphs_tab = self.create_sheet_graphs_tab(sheet_name, self.state.excel_graphs_data[graph_key])
-                
                 # Special naming for Assiette théorique
-                is_special = any(s in sheet_name.lower() for s in ["assiette", "théorique", "theorique"])
+                is_special = is_assiette_sheet(sheet_name)
                 tab_title = "Assiette Théorique" if is_special else f"{sheet_name} Charts"
                 
-                self.tabs.addTab(graphs_tab, tab_title)
+                self._add_lazy_tab(tab_title, partial(
+                    self.create_sheet_graphs_tab, sheet_name, self.state.excel_graphs_data[graph_key]))
     
-    def create_sheet_tab(self, sheet_name, sheet_data):
-        """Create a tab for displaying sheet data."""
+    def create_sheet_tab(self, sheet_name, load_sheet):
+        """Create a tab for displaying sheet data, reusing the sheet's existing table."""
+        cached = self._sheet_tabs.get(sheet_name)
+        if cached is not None and cached[2] is load_sheet:
+            return cached[0]
+        
+        # Read the sheet now that it is shown (a DataFrame or an error message)
+        sheet_data = load_sheet()
+        if cached is not None and cached[1] is not None and isinstance(sheet_data, pd.DataFrame):
+            tab, model, _ = cached
+            model.update_dataframe(sheet_data)
+            self._sheet_tabs[sheet_name] = (tab, model, load_sheet)
+            return tab
+        
+        model = None
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -424,10 +533,11 @@ class ResultsWidget(QWidget):
             # Set up the model
             model = DataFrameModel(sheet_data)
             table_view.setModel(model)
+            use_fixed_row_height(table_view)
             
             # Configure table
             table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-            table_view.setSortingEnabled(True)
+            sort_on_header_click(table_view)
             
             layout.addWidget(table_view)
         else:
@@ -441,6 +551,7 @@ class ResultsWidget(QWidget):
         caption.setStyleSheet("color: #666666; font-style: italic; margin-top: 10px;")
         layout.addWidget(caption)
         
+        self._sheet_tabs[sheet_name] = (tab, model, load_sheet)
         return tab
     
     def create_sheet_graphs_tab(self, sheet_name, graphs_data):
@@ -461,11 +572,11 @@ class ResultsWidget(QWidget):
         scroll_layout = QVBoxLayout(scroll_content)
         
         # Special handling for Assiette théorique
-        is_special = any(s in sheet_name.lower() for s in ["assiette", "théorique", "theorique"])
+        is_special = is_assiette_sheet(sheet_name)
         title = "Assiette Théorique" if is_special else f"{sheet_name} Graphs"
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(AppStyles.font("Arial", 14, QFont.Bold))
         title_label.setStyleSheet("color: white; margin-bottom: 10px;")
         scroll_layout.addWidget(title_label)
         
@@ -481,52 +592,70 @@ class ResultsWidget(QWidget):
         """Display graphs with appropriate sizing."""
         for i, graph in enumerate(graphs_data):
             if isinstance(graph, dict) and 'data' in graph:
-                try:
-                    # Convert base64 to QPixmap
-                    from PySide6.QtGui import QPixmap
-                    from PySide6.QtCore import QByteArray
-                    import base64
+                # Calculate display size
+                size = None
+                if 'width' in graph and 'height' in graph:
+                    orig_width = graph['width']
+                    orig_height = graph['height']
                     
-                    img_data = base64.b64decode(graph['data'])
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(QByteArray(img_data))
+                    # Special sizing for important graphs
+                    max_width = int(self.image_max_width * 1.2) if is_special else self.image_max_width
+                    display_width = min(max_width, orig_width)
                     
-                    # Calculate display size
-                    if 'width' in graph and 'height' in graph:
-                        orig_width = graph['width']
-                        orig_height = graph['height']
-                        
-                        # Special sizing for important graphs
-                        max_width = int(self.image_max_width * 1.2) if is_special else self.image_max_width
-                        display_width = min(max_width, orig_width)
-                        
-                        if orig_width > 0:
-                            scale_factor = display_width / orig_width
-                            display_height = int(orig_height * scale_factor)
-                            pixmap = pixmap.scaled(display_width, display_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    
-                    # Create label and set pixmap
-                    img_label = QLabel()
+                    if orig_width > 0:
+                        scale_factor = display_width / orig_width
+                        size = (display_width, int(orig_height * scale_factor))
+                
+                # Create label; the decoded image is filled in when ready
+                img_label = QLabel()
+                img_label.setAlignment(Qt.AlignCenter)
+                img_label.setFrameShape(QFrame.Box)
+                img_label.setFrameShadow(QFrame.Sunken)
+                img_label.setLineWidth(1)
+                img_label.setStyleSheet("border: 1px solid #DDDDDD; background-color: white; margin: 10px;")
+                
+                # Keyed by content and size, so charts of an earlier file never match
+                cache_key = f"chart_{hash(graph['data'])}_{size}"
+                pixmap = QPixmapCache.find(cache_key)
+                if pixmap is not None:
                     img_label.setPixmap(pixmap)
-                    img_label.setAlignment(Qt.AlignCenter)
-                    img_label.setFrameShape(QFrame.Box)
-                    img_label.setFrameShadow(QFrame.Sunken)
-                    img_label.setLineWidth(1)
-                    img_label.setStyleSheet("border: 1px solid #DDDDDD; background-color: white; margin: 10px;")
-                    
-                    layout.addWidget(img_label)
-                    
-                    # Add separator between graphs
-                    if i < len(graphs_data) - 1:
-                        line = QFrame()
-                        line.setFrameShape(QFrame.HLine)
-                        line.setFrameShadow(QFrame.Sunken)
-                        layout.addWidget(line)
-                        
-                except Exception as e:
-                    error_label = QLabel(f"Error displaying chart {i+1}: {str(e)}")
-                    error_label.setStyleSheet("color: #FF5733;")
-                    layout.addWidget(error_label)
+                else:
+                    self.decode_graph(img_label, i, graph['data'], size, cache_key)
+                
+                layout.addWidget(img_label)
+                
+                # Add separator between graphs
+                if i < len(graphs_data) - 1:
+                    line = QFrame()
+                    line.setFrameShape(QFrame.HLine)
+                    line.setFrameShadow(QFrame.Sunken)
+                    layout.addWidget(line)
+    
+    def decode_graph(self, img_label, index, image_data, size, cache_key):
+        """Decode and scale a chart on the thread pool, then show it in img_label."""
+        img_label.setText("Loading chart...")
+        if size is not None:
+            # Reserve the final size so the layout doesn't jump
+            img_label.setMinimumSize(*size)
+        
+        task = ImageDecodeTask(image_data, size)
+        task.signals.finished.connect(partial(self._on_graph_decoded, task, img_label, cache_key))
+        task.signals.error.connect(partial(self._on_graph_error, task, img_label, index))
+        self._decode_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_graph_decoded(self, task, img_label, cache_key, image):
+        """Show a decoded chart and keep its pixmap for the next time the tab is built."""
+        self._decode_tasks.discard(task)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        img_label.setPixmap(pixmap)
+    
+    def _on_graph_error(self, task, img_label, index, message):
+        """Show why a chart could not be decoded in place of the image."""
+        self._decode_tasks.discard(task)
+        img_label.setStyleSheet("color: #FF5733;")
+        img_label.setText(f"Error displaying chart {index+1}: {message}")
     
     def download_results(self):
         """Download results as Excel file with highlighting."""
@@ -534,77 +663,91 @@ class ResultsWidget(QWidget):
             QMessageBox.warning(self, "No Results", "No analysis results available to download.")
             return
         
-        try:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
-            # Get save file path
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Save Results",
-                os.path.expanduser("~/spring_change_analysis.xlsx"),
-                "Excel Files (*.xlsx)"
-            )
+        # Ignore repeated requests while an export is still being written
+        if self._export_task is not None:
+            return
+        
+        # Get save file path
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Results",
+            os.path.expanduser("~/spring_change_analysis.xlsx"),
+            "Excel Files (*.xlsx)"
+        )
+        
+        if not file_path:
+            return
             
-            if not file_path:
-                QApplication.restoreOverrideCursor()
-                return
-                
-            # Add .xlsx extension if missing
-            if not file_path.endswith('.xlsx'):
-                file_path += '.xlsx'
+        # Add .xlsx extension if missing
+        if not file_path.endswith('.xlsx'):
+            file_path += '.xlsx'
+        
+        # Build the workbook off the GUI thread; the dialog just shows activity
+        task = ExcelExportTask(self.state.results_df, self.state.new_file_path, file_path)
+        task.signals.finished.connect(self._on_export_done)
+        task.signals.error.connect(self._on_export_error)
+        self._export_task = task
+        
+        self._export_progress = QProgressDialog("Exporting results to Excel...", None, 0, 0, self)
+        self._export_progress.setWindowTitle("Export")
+        self._export_progress.setWindowModality(Qt.WindowModal)
+        self._export_progress.setMinimumDuration(0)
+        self._export_progress.show()
+        
+        QThreadPool.globalInstance().start(task)
+    
+    def _finish_export(self):
+        """Clear the in-flight export and close its progress dialog."""
+        task = self._export_task
+        self._export_task = None
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
+        return task
+    
+    def _on_export_done(self, file_path):
+        """Open or report the written report."""
+        task = self._finish_export()
+        
+        if task.highlighted:
+            # Store the path of saved report
+            self.last_saved_report = file_path
             
-            # Create Excel file with highlighting
-            if self.state.new_file_path and os.path.exists(self.state.new_file_path):
-                try:
-                    # Use the original file as template
-                    excel_bytes = FileHandler.create_excel_bytes(
-                        self.state.results_df,
-                        self.state.new_file_path
-                    )
-                    
-                    with open(file_path, 'wb') as f:
-                        f.write(excel_bytes)
-                    
-                    # Store the path of saved report
-                    self.last_saved_report = file_path
-                    
-                    # Directly open the file without confirmation
-                    if os.name == 'nt':  # Windows
-                        os.startfile(file_path)
-                    elif os.name == 'posix':  # macOS and Linux
-                        from subprocess import call
-                        call(('open' if os.name == 'darwin' else 'xdg-open', file_path))
-                except Exception as e:
-                    QApplication.restoreOverrideCursor()
-                    # Fall back to simple export
-                    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                        self.state.results_df.to_excel(writer, sheet_name="Analysis Results", index=False)
-                    
-                    QMessageBox.information(
-                        self, 
-                        "Export Complete", 
-                        f"Results saved successfully to:\n{file_path}\n\n(Simple format - highlighting failed: {str(e)})"
-                    )
-            else:
-                # Basic export
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                    self.state.results_df.to_excel(writer, sheet_name="Analysis Results", index=False)
-                
+            # Directly open the file without confirmation
+            try:
+                if os.name == 'nt':  # Windows
+                    os.startfile(file_path)
+                elif os.name == 'posix':  # macOS and Linux
+                    from subprocess import call
+                    call(('open' if os.name == 'darwin' else 'xdg-open', file_path))
+            except OSError:
+                # No program to open it with; the report is still saved
                 QMessageBox.information(
                     self, 
                     "Export Complete", 
                     f"Results saved successfully to:\n{file_path}"
                 )
-                
-            QApplication.restoreOverrideCursor()
-                
-        except Exception as e:
-            QApplication.restoreOverrideCursor()
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Error saving results: {str(e)}"
+        elif task.highlight_error is not None:
+            QMessageBox.information(
+                self, 
+                "Export Complete", 
+                f"Results saved successfully to:\n{file_path}\n\n(Simple format - highlighting failed: {task.highlight_error})"
             )
+        else:
+            QMessageBox.information(
+                self, 
+                "Export Complete", 
+                f"Results saved successfully to:\n{file_path}"
+            )
+    
+    def _on_export_error(self, message):
+        """Report an export failure raised on the worker thread."""
+        self._finish_export()
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Error saving results: {message}"
+        )
     
     def reset_workflow(self):
         """Reset the application to the upload step and clear previous files."""
@@ -631,11 +774,7 @@ class ResultsWidget(QWidget):
             # Clear both upload frames
             for frame in (uw.old_file_frame, uw.new_file_frame):
                 frame.df = None
-                frame._last_file_path = None
-                frame.status_label.setText("No file selected")
-                frame.status_label.setStyleSheet(
-                    "color: #888888; font-style: italic; font-size: 11px;"
-                )
+                frame.set_status("No file selected", "idle")
                 frame.table_view.setModel(None)
                 frame.table_view.setVisible(False)
             # Hide status and proceed controls
@@ -1,9 +1,26 @@
+from functools import lru_cache
+
+from PySide6.QtGui import QFont
+
+
 class AppStyles:
     """
     Contains styles for the application to maintain consistent look and feel.
     Dark mode theme with blue/sky blue accent colors for better contrast and readability.
     """
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def font(family, size, weight=-1):
+        """
+        Return a shared QFont(family, size, weight), built on first request.
+
+        Fonts can't be class constants: QFont needs the QApplication, which
+        is created after this module is imported. Widgets copy the font in
+        setFont(), so callers must not modify the returned object.
+        """
+        return QFont(family, size, weight)
+    
     # Main colors
     PRIMARY_COLOR = "#4CB9E7"  # Sky blue
     SECONDARY_COLOR = "#3AA1D9"  # Slightly darker sky blue
@@ -130,6 +147,7 @@ class AppStyles:
     HIGHLIGHT_CHANGED_STYLE = "background-color: #CDA000; color: white;"
     
     # Card styles
+    # Whole metric card, set once per card; child labels are styled by objectName
     METRIC_CARD_STYLE = f"""
         QFrame {{
             background-color: {DARK_CARD_BG};
@@ -137,35 +155,26 @@ class AppStyles:
             border-radius: 4px;
             padding: 8px;
         }}
-    """
-    
-    METRIC_TITLE_STYLE = f"""
-        QLabel {{
+        QLabel#metricTitle {{
             font-size: 12px;
             color: {MUTED_TEXT_COLOR};
         }}
-    """
-    
-    METRIC_VALUE_STYLE = f"""
-        QLabel {{
+        QLabel#metricValue {{
             font-size: 24px;
             font-weight: bold;
             color: {TEXT_COLOR};
         }}
-    """
-    
-    METRIC_DELTA_STYLE = f"""
-        QLabel {{
+        QLabel#metricDelta {{
             font-size: 12px;
             color: {PRIMARY_COLOR};
         }}
-    """
-    
-    METRIC_DELTA_NEGATIVE_STYLE = f"""
-        QLabel {{
-            font-size: 12px;
+        QLabel#metricDelta[negative="true"] {{
             color: {ERROR_COLOR};
         }}
+        QLabel#metricHelp {{
+            color: #666;
+            font-size: 10px;
+        }}
     """
     
     # Table styles
@@ -230,6 +239,138 @@ class AppStyles:
         }}
     """
     
+    # Upload page styles
+    UPLOAD_FRAME_STYLE = f"""
+        QFrame {{
+            background-color: {DARK_CARD_BG};
+            border: 1px solid {DARK_BORDER};
+            border-radius: 4px;
+            padding: 15px;
+        }}
+        QLabel {{
+            color: {TEXT_COLOR};
+        }}
+        QLabel#fileStatus[state="idle"] {{
+            color: #888888;
+            font-style: italic;
+            font-size: 11px;
+        }}
+        QLabel#fileStatus[state="ok"] {{
+            color: #4CAF50;
+            font-weight: bold;
+        }}
+        QLabel#fileStatus[state="error"] {{
+            color: #FF5733;
+            font-weight: bold;
+        }}
+    """
+    
+    UPLOAD_BROWSE_BUTTON_STYLE = f"""
+        QPushButton {{
+            background-color: {PRIMARY_COLOR};
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 4px;
+            font-size: 12px;
+            font-weight: bold;
+        }}
+        QPushButton:hover {{
+            background-color: #388E3C;
+        }}
+    """
+    
+    UPLOAD_HEADER_STYLE = f"""
+        QFrame {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
+                stop:0 {PRIMARY_COLOR}, 
+                stop:0.5 #2E7D32,
+                stop:1 #1B5E20);
+            border-radius: 12px;
+            margin: 5px 2px 25px 2px;
+    """
+    
+    PTA_TYPE_FRAME_STYLE = f"""
+        QFrame {{
+            background-color: {DARK_CARD_BG};
+            border: 1px solid {DARK_BORDER};
+            border-radius: 4px;
+            padding: 10px;
+        }}
+        QRadioButton {{
+            color: white;
+            font-size: 14px;
+            padding: 5px;
+        }}
+        QRadioButton:checked {{
+            color: #4CAF50;
+            font-weight: bold;
+        }}
+    """
+    
+    UPLOAD_TABS_STYLE = f"""
+        QTabWidget::pane {{
+            border: 1px solid {DARK_BORDER};
+            border-radius: 4px;
+            background-color: {DARK_CARD_BG};
+            padding: 10px;
+        }}
+        QTabBar::tab {{
+            background-color: {DARK_HIGHLIGHT};
+            color: {TEXT_COLOR};
+            border: 1px solid {DARK_BORDER};
+            border-bottom: none;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+            padding: 8px 12px;
+            margin-right: 2px;
+        }}
+        QTabBar::tab:selected {{
+            background-color: {PRIMARY_COLOR};
+            color: white;
+            border-color: #388E3C;
+            font-weight: bold;
+        }}
+        QTabBar::tab:hover:!selected {{
+            background-color: #3D3D3D;
+        }}
+    """
+    
+    UPLOAD_STATUS_FRAME_STYLE = f"""
+        QFrame {{
+            background-color: {DARK_CARD_BG};
+            border: 1px solid {DARK_BORDER};
+            border-radius: 4px;
+            padding: 15px;
+        }}
+        QLabel#uploadStatus[state="ok"] {{
+            color: #4CAF50;
+            font-weight: bold;
+        }}
+        QLabel#uploadStatus[state="warn"] {{
+            color: #FFC107;
+        }}
+    """
+    
+    PROCEED_BUTTON_STYLE = f"""
+        QPushButton {{
+            background-color: {PRIMARY_COLOR};
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 12px 24px;
+            font-size: 14px;
+            font-weight: bold;
+            min-height: 45px;
+        }}
+        QPushButton:hover {{
+            background-color: #388E3C;
+        }}
+        QPushButton:pressed {{
+            background-color: #1B5E20;
+        }}
+    """
+    
     # App-wide dark mode style
     DARK_MODE_STYLE = f"""
         QWidget {{
@@ -306,3 +447,88 @@ class AppStyles:
             background-color: #3D3D3D;
         }}
     """
+    
+    # Guide page, applied once on GuideWidget; widgets are matched by objectName.
+    # Frame rules also cover descendant frames (labels are QFrames), as the
+    # per-widget stylesheets they replace did.
+    GUIDE_WIDGET_QSS = """
+        QWidget {
+            background-color: #1a1a1a;
+            color: white;
+        }
+        QFrame#guideVideoFrame, QFrame#guideVideoFrame QFrame {
+            background-color: #1a1a1a;
+            border: 2px solid #333;
+            border-radius: 10px;
+        }
+        QLabel#guideTitle {
+            color: white;
+            padding: 20px;
+        }
+        QFrame#guideVideoFrame QFrame#guideVideoContainer, QFrame#guideVideoContainer QFrame {
+            background-color: #000;
+            border-radius: 8px;
+            border: 1px solid #444;
+        }
+        QFrame#guideVideoContainer QFrame#guideVideoStack,
+        QFrame#guideVideoStack > QVideoWidget {
+            background: transparent;
+        }
+        QFrame#guideVideoContainer QLabel#guideImageOverlay {
+            background-color: rgba(0, 0, 0, 200);
+            border-radius: 8px;
+        }
+        QFrame#guideVideoContainer QLabel#guideImageOverlay[placeholder="true"] {
+            background-color: rgba(0, 0, 0, 150);
+            color: white;
+            font-size: 24px;
+            font-weight: bold;
+        }
+        QFrame#guideVideoContainer QLabel#guideVideoError {
+            color: #ff6b6b;
+            font-size: 14px;
+            background-color: #1a1a1a;
+            padding: 20px;
+            border-radius: 8px;
+        }
+        QFrame#guideVideoFrame QFrame#guideControls, QFrame#guideControls QFrame {
+            background-color: #2a2a2a;
+            border-radius: 8px;
+            border: 1px solid #444;
+        }
+        QPushButton#guidePlayButton {
+            background-color: #4a90e2;
+            color: white;
+            border: none;
+            border-radius: 20px;
+            font-size: 16px;
+            font-weight: bold;
+        }
+        QPushButton#guidePlayButton:hover {
+            background-color: #5ba0f2;
+        }
+        QPushButton#guidePlayButton:pressed {
+            background-color: #3a80d2;
+        }
+        QSlider#guideProgressSlider::groove:horizontal {
+            border: 1px solid #444;
+            height: 8px;
+            background: #333;
+            border-radius: 4px;
+        }
+        QSlider#guideProgressSlider::handle:horizontal {
+            background: #4a90e2;
+            border: 1px solid #4a90e2;
+            width: 18px;
+            border-radius: 9px;
+            margin: -5px 0;
+        }
+        QSlider#guideProgressSlider::sub-page:horizontal {
+            background: #4a90e2;
+            border-radius: 4px;
+        }
+        QLabel#guideTimeLabel {
+            color: #ccc;
+            margin-left: 10px;
+        }
+    """
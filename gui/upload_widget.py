@@ -1,44 +1,66 @@
+import os
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFileDialog,
     QRadioButton, QButtonGroup, QFrame, QTableView, QHeaderView,
-    QMessageBox, QSizePolicy, QScrollArea
+    QMessageBox, QSizePolicy, QScrollArea, QStyledItemDelegate, QTabWidget
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont
 
 from utils.app_state import AppState
-from utils.file_handler import FileHandler
-from gui.components.excel_table_model import DataFrameModel
+from gui.components.excel_table_model import DataFrameModel, use_fixed_row_height
 from gui.styling import AppStyles
 
+# Rows of an uploaded file shown in its preview table; analysis uses them all
+PREVIEW_ROWS = 50
+
+@dataclass
+class UploadResult:
+    """Outcome of one file upload, sent with FileUploadFrame.file_uploaded."""
+    ok: bool
+    message: str
+    df: Any = None  # Validated DataFrame when ok
+    path: Optional[str] = None  # File the DataFrame was read from
+
+def set_status_state(label, state):
+    """Restyle a status label through its "state" property (rules live in the upload stylesheets)."""
+    if label.property("state") != state:
+        label.setProperty("state", state)
+        # Re-polish so the property selector applies
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+class HeaderRowDelegate(QStyledItemDelegate):
+    """Item delegate that draws the first row (the column names) in bold."""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.row() == 0:  # First row (headers)
+            font = option.font
+            font.setBold(True)
+            option.font = font
+
 class FileUploadFrame(QFrame):
     """Frame for uploading a single file (either old or new)."""
     
-    file_uploaded = Signal(bool, str, object)  # success, message, dataframe
+    file_uploaded = Signal(object)  # UploadResult
     
     def __init__(self, title, file_type):
         super().__init__()
         self.title = title
         self.file_type = file_type  # "old" or "new"
         self.df = None
-        self._last_file_path = None  # Store the actual file path
+        self._preview_pending = False  # df changed while the frame was hidden
         
         self.init_ui()
     
     def init_ui(self):
         """Initialize the UI components."""
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {AppStyles.DARK_CARD_BG};
-                border: 1px solid {AppStyles.DARK_BORDER};
-                border-radius: 4px;
-                padding: 15px;
-            }}
-            QLabel {{
-                color: {AppStyles.TEXT_COLOR};
-            }}
-        """)
+        self.setStyleSheet(AppStyles.UPLOAD_FRAME_STYLE)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -48,31 +70,19 @@ class FileUploadFrame(QFrame):
         header_layout.setSpacing(10)
         
         file_info = QLabel(f"{self.title}:")
-        file_info.setFont(QFont("Arial", 11))
+        file_info.setFont(AppStyles.font("Arial", 11))
         file_info.setStyleSheet("color: white;")
         header_layout.addWidget(file_info)
         
         self.status_label = QLabel("No file selected")
-        self.status_label.setStyleSheet("color: #888888; font-style: italic; font-size: 11px;")
+        self.status_label.setObjectName("fileStatus")
+        self.status_label.setProperty("state", "idle")
         header_layout.addWidget(self.status_label, 1)  # Give more space to status
         
         self.upload_button = QPushButton("📂 Browse")
         self.upload_button.setFixedWidth(80)
         self.upload_button.setFixedHeight(30)
-        self.upload_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppStyles.PRIMARY_COLOR};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #388E3C;
-            }}
-        """)
+        self.upload_button.setStyleSheet(AppStyles.UPLOAD_BROWSE_BUTTON_STYLE)
         self.upload_button.clicked.connect(self.on_upload_clicked)
         header_layout.addWidget(self.upload_button)
         
@@ -86,7 +96,12 @@ class FileUploadFrame(QFrame):
         self.table_view.setStyleSheet(AppStyles.TABLE_STYLE)
         self.table_view.horizontalHeader().setVisible(False)  # Hide column headers
         self.table_view.verticalHeader().setVisible(False)   # Hide row numbers
+        use_fixed_row_height(self.table_view)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.horizontalHeader().setDefaultSectionSize(180)  # Uniform width
+        # Make first row bold using custom delegate, shared by every preview
+        self._header_delegate = HeaderRowDelegate(self.table_view)
+        self.table_view.setItemDelegate(self._header_delegate)
         self.table_view.setVisible(False)
         layout.addWidget(self.table_view)
         
@@ -104,68 +119,59 @@ class FileUploadFrame(QFrame):
         if not file_path:
             return
         
-        # Store the file path
-        self._last_file_path = file_path
-        
-        # Process the file
+        # Process the file (openpyxl is only loaded once a file is picked)
+        from utils.file_handler import FileHandler
         try:
             is_valid, comment, df = FileHandler.validate_excel_file(file_path, self.file_type)
             
             if is_valid:
                 # Update status
-                self.status_label.setText(f"✅ File loaded: {file_path.split('/')[-1]}")
-                self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+                self.set_status(f"✅ File loaded: {os.path.basename(file_path)}", "ok")
                 
                 # Show preview
                 self.df = df
                 self.update_preview()
                 
                 # Emit signal
-                self.file_uploaded.emit(True, "File uploaded successfully", df)
+                self.file_uploaded.emit(UploadResult(True, "File uploaded successfully", df, file_path))
             else:
-                self.status_label.setText(f"❌ {comment}")
-                self.status_label.setStyleSheet("color: #FF5733; font-weight: bold;")
+                self.set_status(f"❌ {comment}", "error")
                 self.table_view.setVisible(False)
-                self.file_uploaded.emit(False, comment, None)
+                self.file_uploaded.emit(UploadResult(False, comment))
                 
         except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #FF5733; font-weight: bold;")
+            self.set_status(f"❌ Error: {str(e)}", "error")
             self.table_view.setVisible(False)
-            self.file_uploaded.emit(False, str(e), None)
+            self.file_uploaded.emit(UploadResult(False, str(e)))
+    
+    def set_status(self, text, state):
+        """Show a status message styled as "idle", "ok" or "error"."""
+        self.status_label.setText(text)
+        set_status_state(self.status_label, state)
+    
+    def showEvent(self, event):
+        """Build a preview that was deferred while the frame was hidden."""
+        super().showEvent(event)
+        if self._preview_pending:
+            self.update_preview()
     
     def update_preview(self):
-        """Update the preview table with the loaded DataFrame."""
+        """Update the preview table with the loaded DataFrame, once the frame is visible."""
+        # A hidden tab's table is only filled when the tab is shown
+        self._preview_pending = not self.isVisible()
+        if self._preview_pending:
+            return
         if self.df is not None:
-            model = DataFrameModel(self.df)
+            model = DataFrameModel(self.df.head(PREVIEW_ROWS))
             self.table_view.setModel(model)
             
-            # Set uniform column width for better readability
-            for col in range(model.columnCount()):
-                self.table_view.setColumnWidth(col, 180)  # Uniform width
-            
-            # Set first row (header) height slightly bigger
+            # Set first row (header) height slightly bigger; data rows and
+            # columns take the headers' default sizes
             self.table_view.setRowHeight(0, 35)  # Header row
             
-            # Set data rows height
-            for row in range(1, model.rowCount()):
-                self.table_view.setRowHeight(row, 30)
-            
             # Set first row (headers) to be bold using Qt's font mechanism
             self.table_view.setSortingEnabled(False)  # Disable sorting since headers are in data
             self.table_view.setVisible(True)
-            
-            # Make first row bold using custom delegate
-            from PySide6.QtWidgets import QStyledItemDelegate
-            class HeaderRowDelegate(QStyledItemDelegate):
-                def initStyleOption(self, option, index):
-                    super().initStyleOption(option, index)
-                    if index.row() == 0:  # First row (headers)
-                        font = option.font
-                        font.setBold(True)
-                        option.font = font
-            
-            self.table_view.setItemDelegate(HeaderRowDelegate())
 
 
 class UploadWidget(QWidget):
@@ -178,28 +184,19 @@ class UploadWidget(QWidget):
     
     def init_ui(self):
         """Initialize the user interface."""
-        # Apply dark mode style
-        self.setStyleSheet(AppStyles.DARK_MODE_STYLE)
+        # Dark mode comes from the application-wide stylesheet set in main()
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Header with container
         header_container = QFrame()
-        header_container.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 {AppStyles.PRIMARY_COLOR}, 
-                    stop:0.5 #2E7D32,
-                    stop:1 #1B5E20);
-                border-radius: 12px;
-                margin: 5px 2px 25px 2px;
-        """)
+        header_container.setStyleSheet(AppStyles.UPLOAD_HEADER_STYLE)
         header_layout = QVBoxLayout(header_container)
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         header_label = QLabel("📁 Step 1: Upload Your Excel Files")
-        header_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
+        header_label.setFont(AppStyles.font("Segoe UI", 20, QFont.Bold))
         header_label.setStyleSheet("""
             color: white;
             padding: 20px;
@@ -212,27 +209,11 @@ class UploadWidget(QWidget):
 
         # PTA Type selection with enhanced styling
         pta_type_frame = QFrame()
-        pta_type_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {AppStyles.DARK_CARD_BG};
-                border: 1px solid {AppStyles.DARK_BORDER};
-                border-radius: 4px;
-                padding: 10px;
-            }}
-            QRadioButton {{
-                color: white;
-                font-size: 14px;
-                padding: 5px;
-            }}
-            QRadioButton:checked {{
-                color: #4CAF50;
-                font-weight: bold;
-            }}
-        """)
+        pta_type_frame.setStyleSheet(AppStyles.PTA_TYPE_FRAME_STYLE)
         pta_type_layout = QVBoxLayout(pta_type_frame)
         
         pta_type_label = QLabel("🚗 Select PTA Type:")
-        pta_type_label.setFont(QFont("Arial", 12, QFont.Bold))
+        pta_type_label.setFont(AppStyles.font("Arial", 12, QFont.Bold))
         pta_type_label.setStyleSheet("color: white; margin-bottom: 5px;")
         pta_type_layout.addWidget(pta_type_label)
         
@@ -258,43 +239,16 @@ class UploadWidget(QWidget):
         pta_type_layout.addLayout(radio_layout)
         layout.addWidget(pta_type_frame)
         
-        # Connect radio button signals
+        # Connect radio button signals (after the default is checked, so
+        # setting it up doesn't call the slot)
         self.vp_radio.toggled.connect(self.on_pta_type_changed)
         
         # Add spacing
         layout.addSpacing(10)
         
         # Add tabs for file upload
-        from PySide6.QtWidgets import QTabWidget
-        
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {AppStyles.DARK_BORDER};
-                border-radius: 4px;
-                background-color: {AppStyles.DARK_CARD_BG};
-                padding: 10px;
-            }}
-            QTabBar::tab {{
-                background-color: {AppStyles.DARK_HIGHLIGHT};
-                color: {AppStyles.TEXT_COLOR};
-                border: 1px solid {AppStyles.DARK_BORDER};
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 12px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {AppStyles.PRIMARY_COLOR};
-                color: white;
-                border-color: #388E3C;
-                font-weight: bold;
-            }}
-            QTabBar::tab:hover:!selected {{
-                background-color: #3D3D3D;
-            }}
-        """)
+        self.tabs.setStyleSheet(AppStyles.UPLOAD_TABS_STYLE)
         
         # Create file upload frames in tabs
         self.old_file_frame = FileUploadFrame("Select Old PTA File", "old")
@@ -311,42 +265,19 @@ class UploadWidget(QWidget):
         
         # Status and proceed section with enhanced styling
         self.status_frame = QFrame()
-        self.status_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {AppStyles.DARK_CARD_BG};
-                border: 1px solid {AppStyles.DARK_BORDER};
-                border-radius: 4px;
-                padding: 15px;
-            }}
-        """)
+        self.status_frame.setStyleSheet(AppStyles.UPLOAD_STATUS_FRAME_STYLE)
         status_layout = QVBoxLayout(self.status_frame)
         status_layout.setSpacing(15)
         
         self.status_label = QLabel("")
-        self.status_label.setFont(QFont("Arial", 12))
+        self.status_label.setObjectName("uploadStatus")
+        self.status_label.setFont(AppStyles.font("Arial", 12))
         self.status_label.setVisible(False)
         self.status_label.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.status_label)
         
         self.proceed_button = QPushButton("🔍 Proceed to Analysis")
-        self.proceed_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {AppStyles.PRIMARY_COLOR};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-                min-height: 45px;
-            }}
-            QPushButton:hover {{
-                background-color: #388E3C;
-            }}
-            QPushButton:pressed {{
-                background-color: #1B5E20;
-            }}
-        """)
+        self.proceed_button.setStyleSheet(AppStyles.PROCEED_BUTTON_STYLE)
         self.proceed_button.setVisible(False)
         self.proceed_button.clicked.connect(self.on_proceed_clicked)
         status_layout.addWidget(self.proceed_button)
@@ -364,44 +295,46 @@ class UploadWidget(QWidget):
         else:
             self.state.pta_type = "VU"
     
-    def on_old_file_uploaded(self, success, message, df):
+    def on_old_file_uploaded(self, result):
         """Handle old file upload completion."""
-        if success:
-            self.state.old_df = df
-            # Store the actual file path, not button text
-            file_path = getattr(self.old_file_frame, '_last_file_path', None)
-            self.state.old_file_path = file_path
+        if result.ok:
+            self.state.old_df = result.df
+            self.state.old_file_path = result.path
         else:
             self.state.old_df = None
             self.state.old_file_path = None
-            QMessageBox.warning(self, "Upload Error", message)
+            self._warn_upload_error(result.message)
         
         self.update_status()
     
-    def on_new_file_uploaded(self, success, message, df):
+    def on_new_file_uploaded(self, result):
         """Handle new file upload completion."""
-        if success:
-            self.state.new_df = df
-            # Store the actual file path, not button text
-            file_path = getattr(self.new_file_frame, '_last_file_path', None)
-            self.state.new_file_path = file_path
+        if result.ok:
+            self.state.new_df = result.df
+            self.state.new_file_path = result.path
         else:
             self.state.new_df = None
             self.state.new_file_path = None
-            QMessageBox.warning(self, "Upload Error", message)
+            self._warn_upload_error(result.message)
         
         self.update_status()
     
+    def _warn_upload_error(self, message):
+        """Show an upload error once control is back in the event loop."""
+        # Queued, so the status labels update and repaint before the modal
+        # dialog opens (tied to self, so it is dropped if the page is gone)
+        QTimer.singleShot(0, self, partial(QMessageBox.warning, self, "Upload Error", message))
+    
     def update_status(self):
         """Update status message and proceed button visibility."""
         if self.state.old_df is not None and self.state.new_df is not None:
             self.status_label.setText("✅ Both files uploaded successfully! You can now proceed to analysis.")
-            self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+            set_status_state(self.status_label, "ok")
             self.status_label.setVisible(True)
             self.proceed_button.setVisible(True)
         elif self.state.old_df is not None or self.state.new_df is not None:
             self.status_label.setText("📋 Please upload both files to proceed.")
-            self.status_label.setStyleSheet("color: #FFC107;")
+            set_status_state(self.status_label, "warn")
             self.status_label.setVisible(True)
             self.proceed_button.setVisible(False)
         else:
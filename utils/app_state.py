@@ -1,5 +1,7 @@
-import pandas as pd
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class AppState:
     """
@@ -7,12 +9,32 @@ class AppState:
     Replaces Streamlit's session_state functionality.
     """
     
+    # Fixed attribute set: no per-instance __dict__, and a mistyped
+    # attribute name raises instead of silently creating new state
+    __slots__ = (
+        "results_version",
+        "old_df", "new_df", "results_df", "old_file_path", "new_file_path",
+        "pta_type", "current_step", "analysis_completed",
+        "excel_sheets_data", "excel_graphs_data", "excel_data_source",
+        "results_summary",
+    )
+    
+    # Attributes the results page is rendered from; assigning any of them
+    # bumps results_version
+    RESULT_ATTRIBUTES = frozenset({
+        "old_df", "new_df", "results_df", "new_file_path",
+        "excel_sheets_data", "excel_graphs_data",
+    })
+    
     def __init__(self):
         """Initialize application state with default values."""
+        # Incremented on every change to the data shown on the results page
+        self.results_version: int = 0
+        
         # Data state
-        self.old_df: Optional[pd.DataFrame] = None
-        self.new_df: Optional[pd.DataFrame] = None
-        self.results_df: Optional[pd.DataFrame] = None
+        self.old_df: Optional["pd.DataFrame"] = None
+        self.new_df: Optional["pd.DataFrame"] = None
+        self.results_df: Optional["pd.DataFrame"] = None
         self.old_file_path: Optional[str] = None
         self.new_file_path: Optional[str] = None
         
@@ -26,6 +48,16 @@ class AppState:
         # Cache for Excel sheets data
         self.excel_sheets_data: Dict[str, Any] = {}
         self.excel_graphs_data: Dict[str, Any] = {}
+        # (path, modification time) of the file the sheets were read from
+        self.excel_data_source: Optional[Tuple[str, float]] = None
+        
+        # (results DataFrame, its analysis summary), for the last summary computed
+        self.results_summary: Optional[Tuple["pd.DataFrame", Any]] = None
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.RESULT_ATTRIBUTES:
+            super().__setattr__("results_version", self.results_version + 1)
     
     def reset_data(self):
         """Reset all data-related state."""
@@ -36,6 +68,8 @@ class AppState:
         self.new_file_path = None
         self.excel_sheets_data = {}
         self.excel_graphs_data = {}
+        self.excel_data_source = None
+        self.results_summary = None
         self.analysis_completed = False
         self.current_step = 0  # Reset to upload step
     
@@ -2,15 +2,20 @@
 This module handles file operations for the Spring Change Detection application.
 It validates Excel files, processes data, and creates output files.
 """
-from typing import Tuple, Optional, Any, Dict
+from typing import Tuple, Optional, Any, Dict, Callable
+import datetime
+import logging
 import os
-import io
+import shutil
+from functools import lru_cache, partial
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, Color
 from openpyxl.utils import get_column_letter
 from openpyxl.drawing.image import Image
-import base64
+
+log = logging.getLogger(__name__)
 
 # Configuration - similar to original application
 UPLOAD_CONFIG = {
@@ -25,6 +30,42 @@ REQUIRED_COLUMNS = {
     "reference": "Référence"
 }
 
+# Row highlighting per change type: (fill color, font color), as opaque
+# ARGB (openpyxl pads 6-digit colors with a 00, i.e. transparent, alpha)
+CHANGE_HIGHLIGHTS = {
+    "New": ("FFFF5733", "FFFFFFFF"),
+    "Spring Changed": ("FFB4C6E7", "FF000000"),
+}
+
+# openpyxl style objects are immutable, so one fill/font pair per change
+# type is shared by every highlighted cell of every export
+HIGHLIGHT_STYLES = {
+    change_type: (PatternFill('solid', fgColor=fill), Font(color=font))
+    for change_type, (fill, font) in CHANGE_HIGHLIGHTS.items()
+}
+
+# Header row style of the plain results export (the one DataFrame.to_excel uses)
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(
+    left=Side(style="thin"), right=Side(style="thin"),
+    top=Side(style="thin"), bottom=Side(style="thin"),
+)
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+# Number formats DataFrame.to_excel gives date and datetime cells
+DATE_FORMAT = "YYYY-MM-DD"
+DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+# Engine for reading uploads: the Rust-based calamine reader when
+# python-calamine is installed, else openpyxl (both give the same frames)
+try:
+    import python_calamine  # noqa: F401
+    READ_ENGINE = "calamine"
+except ImportError:
+    READ_ENGINE = "openpyxl"
+
+# Validated uploads kept in memory, so re-selecting a file skips the parse
+VALIDATION_CACHE_SIZE = 4
+
 class FileHandler:
     """Handles validation and export of Excel files."""
 
@@ -42,6 +83,10 @@ class FileHandler:
               - validity (bool)
               - message (str)
               - DataFrame if valid, else None
+
+        The result for an unchanged file (same path, size and modification
+        time) is cached, so the returned DataFrame may be shared between
+        calls and must not be modified in place.
         """
         if not file_path:
             return False, f"No '{file_label}' file selected.", None
@@ -53,14 +98,37 @@ class FileHandler:
         if file_ext not in UPLOAD_CONFIG["allowed_extension"]:
             return False, f"Invalid file format. Please upload an Excel file (.xlsx or .xls).", None
         
-        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        stat = os.stat(file_path)
+        file_size_mb = stat.st_size / (1024 * 1024)
         if file_size_mb > UPLOAD_CONFIG["max_file_size"]:
             return False, f"File size exceeds {UPLOAD_CONFIG['max_file_size']} MB.", None
         
+        return FileHandler._read_and_validate(file_path, stat.st_size, stat.st_mtime, file_label)
+    
+    @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+    def _read_and_validate(file_path: str, size: int, mtime: float, file_label: str) -> Tuple[bool, str, Optional[pd.DataFrame]]:
+        """
+        Read the PTA sheet of a file and check its columns.
+        
+        Args:
+            file_path: Path to the Excel file.
+            size: File size in bytes, part of the cache key.
+            mtime: Modification time, part of the cache key.
+            file_label: A label for the file (e.g., "old", "new").
+            
+        Returns:
+            Same tuple as validate_excel_file.
+        """
+        # Reject a file without the PTA sheet or its columns before parsing it
+        is_valid, msg = FileHandler._check_pta_header(file_path, file_label)
+        if not is_valid:
+            return False, msg, None
+        
         try:
             df = pd.read_excel(
                 file_path,
-                engine="openpyxl",
+                engine=READ_ENGINE,
                 sheet_name=UPLOAD_CONFIG["sheet_name"],
                 skiprows=UPLOAD_CONFIG["skip_rows"],
             ).reset_index(drop=True)
@@ -70,19 +138,54 @@ class FileHandler:
         if df.empty:
             return False, f"'{file_label}' file is empty.", None
         
-        is_valid, msg = FileHandler._validate_columns(df)
+        is_valid, msg = FileHandler._validate_columns(df.columns)
         if not is_valid:
             return False, msg, None
         
         return True, "File uploaded successfully.", df
     
     @staticmethod
-    def _validate_columns(df: pd.DataFrame) -> Tuple[bool, str]:
+    def _check_pta_header(file_path: str, file_label: str) -> Tuple[bool, str]:
+        """
+        Check that an .xlsx file has the PTA sheet and its required columns.
+        
+        Only the workbook index and the sheet's first (header) row are read,
+        in read-only mode. Other formats pass through to the full read.
+        
+        Args:
+            file_path: Path to the Excel file.
+            file_label: A label for the file (e.g., "old", "new").
+            
+        Returns:
+            Tuple with validity status and error message.
+        """
+        if not file_path.lower().endswith(".xlsx"):
+            return True, ""
+        
+        sheet_name = UPLOAD_CONFIG["sheet_name"]
+        try:
+            wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+            try:
+                if sheet_name not in wb.sheetnames:
+                    return False, f"Sheet '{sheet_name}' not found in '{file_label}' file."
+                header = next(wb[sheet_name].iter_rows(max_row=1, values_only=True), ())
+            finally:
+                wb.close()
+        except Exception as e:
+            return False, f"Error reading '{file_label}' file: {e}"
+        
+        if all(value is None for value in header):
+            # pandas takes the first non-blank row as the header; leave that to the full read
+            return True, ""
+        return FileHandler._validate_columns(header)
+    
+    @staticmethod
+    def _validate_columns(columns) -> Tuple[bool, str]:
         """
-        Check for required columns in the DataFrame.
+        Check for required columns among a sheet's column names.
         
         Args:
-            df: DataFrame to validate.
+            columns: Column names (DataFrame columns or a header row).
             
         Returns:
             Tuple with validity status and error message.
@@ -91,29 +194,48 @@ class FileHandler:
             REQUIRED_COLUMNS["mass"],
             REQUIRED_COLUMNS["reference"],
         ]
-        missing = [col for col in required_cols if col not in df.columns]
+        missing = [col for col in required_cols if col not in columns]
         if missing:
             return False, f"Missing columns: {', '.join(missing)}."
         return True, ""
     
     @staticmethod
-    def create_excel_bytes(results_df: pd.DataFrame, original_file_path: str = None) -> bytes:
+    def write_excel_to_path(results_df: pd.DataFrame, original_file_path: str, out_path: str) -> None:
         """
-        Generate Excel report that preserves the original file structure 
+        Write an Excel report that preserves the original file structure 
         and only adds highlighting to changed/new rows.
         
+        The workbook is saved straight to out_path, without an in-memory
+        copy of the file. When no row needs highlighting the original file
+        is copied as is.
+        
         Args:
             results_df: Analysis results with metadata.
             original_file_path: Path to the original Excel file.
-            
-        Returns:
-            Byte content of the Excel file with highlighting.
+            out_path: Destination path of the report.
         """
-        output = io.BytesIO()
-        
         if not original_file_path or not os.path.exists(original_file_path):
             raise ValueError("Original file path is required and must exist.")
         
+        # Create a mapping of Cell ID to Change Type for faster lookup,
+        # holding only the rows that get highlighted (one vectorized
+        # filter, then a zip over plain Python lists)
+        cell_id_to_change = {}
+        if 'Cell ID New' in results_df.columns and 'Change Type' in results_df.columns:
+            change_types = results_df['Change Type']
+            cell_ids = results_df['Cell ID New']
+            highlighted = (change_types.isin(list(CHANGE_HIGHLIGHTS)) & cell_ids.notna()).to_numpy()
+            cell_id_to_change = dict(zip(
+                cell_ids.to_numpy()[highlighted].tolist(),
+                change_types.to_numpy()[highlighted].tolist(),
+            ))
+        
+        if not cell_id_to_change:
+            # Nothing to highlight: the report is the original file as is,
+            # so skip the workbook load and save
+            shutil.copyfile(original_file_path, out_path)
+            return
+        
         try:
             # Load the original workbook
             wb = load_workbook(original_file_path)
@@ -125,73 +247,120 @@ class FileHandler:
                 # Find data start row (after skipping header rows)
                 start_row = UPLOAD_CONFIG["skip_rows"][0] + 2  # Skip header + extra row
                 
-                # Create a mapping of Cell ID to Change Type for faster lookup
-                cell_id_to_change = {}
-                if 'Cell ID New' in results_df.columns and 'Change Type' in results_df.columns:
-                    for _, row in results_df.iterrows():
-                        cell_id_to_change[row['Cell ID New']] = row['Change Type']
-                
-                # Apply highlighting to rows based on analysis results
-                row_idx = start_row
-                max_iterations = 10000  # Prevent infinite loops
-                iterations = 0
+                # Data runs to the sheet's last row: blank rows inside it
+                # don't end it, and only the rows to highlight are styled,
+                # each across the full sheet width
+                end_row = ws.max_row + 1
                 
-                while iterations < max_iterations:
-                    # Check if we've reached the end of data
-                    if ws.cell(row=row_idx, column=1).value is None:
-                        break
-                    
-                    # Get cell ID (Excel row number)
-                    cell_id = row_idx
-                    
-                    # Check if this row has changes
-                    if cell_id in cell_id_to_change:
-                        change_type = cell_id_to_change[cell_id]
-                        
-                        if change_type == 'New':
-                            # Highlight new rows with red background and white text
-                            fill = PatternFill('solid', fgColor='FF5733')
-                            font = Font(color='FFFFFF')  # White text for better contrast
-                            
-                            for col in range(1, ws.max_column + 1):
-                                cell = ws.cell(row=row_idx, column=col)
-                                cell.fill = fill
-                                cell.font = font
-                                
-                        elif change_type == 'Spring Changed':
-                            # Highlight spring changed rows with blue background
-                            fill = PatternFill('solid', fgColor='B4C6E7')
-                            font = Font(color='000000')  # Black text for better contrast
-                            
-                            for col in range(1, ws.max_column + 1):
-                                cell = ws.cell(row=row_idx, column=col)
-                                cell.fill = fill
-                                cell.font = font
-                    
-                    row_idx += 1
-                    iterations += 1
+                # Cell ID is the Excel row number
+                max_col = ws.max_column  # Scans every cell, so read it once
+                for row_idx, change_type in cell_id_to_change.items():
+                    if not start_row <= row_idx < end_row:
+                        continue
+                    fill, font = HIGHLIGHT_STYLES[change_type]
+                    row_idx = int(row_idx)
+                    row = next(ws.iter_rows(min_row=row_idx, max_row=row_idx, max_col=max_col))
+                    for cell in row:
+                        cell.fill = fill
+                        cell.font = font
             
             # Save the modified workbook
-            wb.save(output)
-            output.seek(0)
-            return output.getvalue()
+            wb.save(out_path)
+            
+        except Exception:
+            # If highlighting fails, save the original file unchanged
+            log.exception("Error adding highlighting")
+            shutil.copyfile(original_file_path, out_path)
+    
+    @staticmethod
+    def write_results_excel(results_df: pd.DataFrame, file_path: str) -> None:
+        """
+        Write analysis results to a new Excel file, as DataFrame.to_excel would.
+        
+        Uses an openpyxl write-only workbook, so rows are streamed to the
+        file as they are appended instead of being kept as cell objects.
+        
+        Args:
+            results_df: Analysis results to export.
+            file_path: Destination .xlsx path.
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Analysis Results")
+        
+        # Header cells styled like pandas' to_excel header
+        header = []
+        for col in results_df.columns:
+            cell = WriteOnlyCell(ws, value=str(col))
+            cell.font = HEADER_FONT
+            cell.border = HEADER_BORDER
+            cell.alignment = HEADER_ALIGNMENT
+            header.append(cell)
+        ws.append(header)
+        
+        for row in results_df.itertuples(index=False, name=None):
+            ws.append(FileHandler._row_cells(ws, row))
+        
+        wb.save(file_path)
+    
+    @staticmethod
+    def _row_cells(ws, row: tuple) -> list:
+        """
+        Prepare one results row for a write-only sheet, as DataFrame.to_excel would.
+        
+        Missing values (NaN, None, NaT, pd.NA) become empty cells, and dates
+        get pandas' date and datetime number formats.
+        
+        Args:
+            ws: The write-only worksheet the row is appended to.
+            row: Values of the row, in column order.
+            
+        Returns:
+            The row's values, with dates wrapped in formatted cells.
+        """
+        cells = []
+        for value in row:
+            if pd.isna(value):
+                value = None
+            elif isinstance(value, (datetime.datetime, datetime.date)):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.number_format = (
+                    DATETIME_FORMAT if isinstance(value, datetime.datetime) else DATE_FORMAT
+                )
+                value = cell
+            cells.append(value)
+        return cells
+    
+    @staticmethod
+    def read_sheet(file_path: str, sheet_name: str) -> Any:
+        """
+        Read one sheet of an Excel file.
+        
+        Args:
+            file_path: Path to the Excel file.
+            sheet_name: Name of the sheet to read.
             
+        Returns:
+            The sheet as a DataFrame, or an error message if it can't be read.
+        """
+        try:
+            return pd.read_excel(file_path, sheet_name=sheet_name, engine=READ_ENGINE)
         except Exception as e:
-            # If highlighting fails, return original file
-            print(f"Error adding highlighting: {str(e)}")
-            with open(original_file_path, 'rb') as f:
-                return f.read()
+            return f"Error loading sheet: {str(e)}"
     
     @staticmethod
-    def extract_sheets_and_graphs(file_path: str) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Any]]:
+    def extract_sheets_and_graphs(file_path: str) -> Tuple[Dict[str, Callable[[], Any]], Dict[str, Any]]:
         """
         Extract all sheets and graphical elements from an Excel file.
         
+        Sheets are not parsed here: each one maps to a loader that reads it
+        (see read_sheet) when called, so only the sheets actually shown are
+        turned into DataFrames.
+        
         Args:
             file_path: Path to the Excel file.
             
         Returns:
-            Tuple with dictionaries of sheets data and graphs data.
+            Tuple with dictionaries of sheet loaders and graphs data.
         """
         sheets_data = {}
         graphs_data = {}
@@ -200,22 +369,16 @@ class FileHandler:
             return sheets_data, graphs_data
         
         try:
-            # Get all sheet names
-            excel_file = pd.ExcelFile(file_path)
-            sheet_names = excel_file.sheet_names
+            # Images need a non-read-only load; external links are never
+            # used, so they're skipped
+            wb = load_workbook(file_path, data_only=True, keep_links=False)
             
-            # Extract sheet data
-            for sheet_name in sheet_names:
-                try:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name)
-                    sheets_data[sheet_name] = df
-                except Exception as e:
-                    sheets_data[sheet_name] = f"Error loading sheet: {str(e)}"
+            # One loader per sheet, read on demand
+            for sheet_name in wb.sheetnames:
+                sheets_data[sheet_name] = partial(FileHandler.read_sheet, file_path, sheet_name)
             
             # Extract charts/images
             try:
-                wb = load_workbook(file_path, data_only=True)
-                
                 # Process each sheet
                 for sheet_name in wb.sheetnames:
                     sheet_graphs = []
@@ -227,27 +390,27 @@ class FileHandler:
                             try:
                                 img_data = img._data()
                                 if img_data:
-                                    # Convert to base64 for storing
-                                    img_b64 = base64.b64encode(img_data).decode()
-                                    
-                                    # Store with metadata
+                                    # Store the encoded image bytes with metadata;
+                                    # they are decoded straight into a QImage
                                     sheet_graphs.append({
-                                        'data': img_b64,
+                                        'data': img_data,
                                         'width': img.width,
                                         'height': img.height
                                     })
                             except Exception:
+                                # Unreadable image: skip it (formatted only if debug logging is on)
+                                log.debug("Skipping unreadable image in sheet %s", sheet_name, exc_info=True)
                                 continue
                     
                     # Store graphs for this sheet
                     if sheet_graphs:
                         graphs_data[f"{sheet_name} Graphs"] = sheet_graphs
-            except Exception as e:
+            except Exception:
                 # Log error but continue
-                print(f"Error extracting graphs: {str(e)}")
+                log.exception("Error extracting graphs")
             
-        except Exception as e:
+        except Exception:
             # Log error but return what we have
-            print(f"Error extracting sheets: {str(e)}")
+            log.exception("Error extracting sheets")
         
         return sheets_data, graphs_data
\ No newline at end of file